@@ -16,6 +16,7 @@ Usage
 
 from __future__ import annotations
 
+import functools
 import logging
 
 import openai
@@ -23,6 +24,12 @@ import openai
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: str) -> openai.OpenAI:
+    """Return a shared OpenAI client, so its HTTP connection pool is reused."""
+    return openai.OpenAI(api_key=api_key)
+
+
 def build_messages(
     system_prompt: str,
     context: str,
@@ -101,7 +108,7 @@ def chat(
     str
         The assistant's response text.
     """
-    client = openai.OpenAI(api_key=api_key)
+    client = _openai_client(api_key)
     messages = build_messages(system_prompt, context, history, question)
 
     kwargs: dict = {"model": model, "messages": messages}
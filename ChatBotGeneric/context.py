@@ -23,9 +23,8 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-import openai
-
 from tools.pinecone.config import PineconeConfig
+from tools.pinecone.embeddings import make_embed_fn as _make_embed_fn
 from tools.pinecone.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
@@ -46,13 +45,7 @@ def make_embed_fn(api_key: str, model: str = "text-embedding-3-small"):
     callable
         A function ``embed(text: str) -> list[float]``.
     """
-    client = openai.OpenAI(api_key=api_key)
-
-    def embed(text: str) -> list[float]:
-        response = client.embeddings.create(input=text, model=model)
-        return response.data[0].embedding
-
-    return embed
+    return _make_embed_fn(api_key=api_key, model=model)
 
 
 def retrieve_context(
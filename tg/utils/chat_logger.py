@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 from telegram import Update
@@ -28,8 +28,30 @@ logger = logging.getLogger(__name__)
 _DEFAULT_LOG_DIR = Path(__file__).resolve().parent.parent / "log"
 _DEFAULT_LOG_FILE = _DEFAULT_LOG_DIR / "chat_log.jsonl"
 
+# Attributes copied from each update object, in log order.
+_USER_FIELDS = (
+    "id", "is_bot", "first_name", "last_name", "username",
+    "language_code", "is_premium",
+)
+_CHAT_FIELDS = ("id", "type", "title", "username", "first_name", "last_name")
+_ENTITY_FIELDS = ("type", "offset", "length")
 
-def log_update(update: Update, log_file: str | Path | None = None) -> dict:
+# Templates for absent objects — copied on emit so entries never share state.
+_NULL_USER = dict.fromkeys(_USER_FIELDS)
+_NULL_CHAT = dict.fromkeys(_CHAT_FIELDS)
+
+# Log directories already created by this process — skips a mkdir per update.
+_MKDIR_DONE: set[Path] = set()
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") — reformatted only when the second changes.
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def log_update(
+    update: Update,
+    log_file: str | Path | None = None,
+    include_raw: bool = False,
+) -> dict:
     """Append all available information from a Telegram update to a JSONL file.
 
     Parameters
@@ -39,6 +61,10 @@ def log_update(update: Update, log_file: str | Path | None = None) -> dict:
     log_file : str | Path | None
         Path to the JSONL log file.  Defaults to
         ``tg/log/chat_log.jsonl``.
+    include_raw : bool
+        Also store the full ``update.to_dict()`` under ``"raw"``.  Off by
+        default — serialising the whole update tree is the most expensive
+        part of building an entry and duplicates the extracted fields.
 
     Returns
     -------
@@ -46,9 +72,11 @@ def log_update(update: Update, log_file: str | Path | None = None) -> dict:
         The log entry that was written (useful for chaining / inspection).
     """
     path = Path(log_file) if log_file else _DEFAULT_LOG_FILE
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.parent not in _MKDIR_DONE:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _MKDIR_DONE.add(path.parent)
 
-    entry = build_log_entry(update)
+    entry = build_log_entry(update, include_raw=include_raw)
 
     with open(path, "a", encoding="utf-8") as f:
         f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
@@ -57,56 +85,71 @@ def log_update(update: Update, log_file: str | Path | None = None) -> dict:
     return entry
 
 
-def build_log_entry(update: Update) -> dict:
+def build_log_entry(update: Update, include_raw: bool = False) -> dict:
     """Build a structured log entry from a Telegram update.
 
     Parameters
     ----------
     update : telegram.Update
         The incoming Telegram update object.
+    include_raw : bool
+        Add the full ``update.to_dict()`` under ``"raw"``.
 
     Returns
     -------
     dict
         A dictionary containing timestamp, update_id, message details,
-        user metadata, chat metadata, and the raw update dict.
+        user metadata, chat metadata, and (if *include_raw*) the raw
+        update dict.
     """
     msg = update.message
     user = update.effective_user
     chat = update.effective_chat
 
-    return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "update_id": update.update_id,
-        "message": {
-            "message_id": msg.message_id if msg else None,
-            "date": msg.date.isoformat() if msg and msg.date else None,
-            "text": msg.text if msg else None,
+    if msg is None:
+        message = {"message_id": None, "date": None, "text": None, "entities": []}
+    else:
+        message = {
+            "message_id": msg.message_id,
+            "date": msg.date.isoformat() if msg.date else None,
+            "text": msg.text,
             "entities": [
-                {
-                    "type": e.type,
-                    "offset": e.offset,
-                    "length": e.length,
-                }
-                for e in (msg.entities or [])
-            ] if msg else [],
-        },
-        "user": {
-            "id": user.id if user else None,
-            "is_bot": user.is_bot if user else None,
-            "first_name": user.first_name if user else None,
-            "last_name": user.last_name if user else None,
-            "username": user.username if user else None,
-            "language_code": user.language_code if user else None,
-            "is_premium": user.is_premium if user else None,
-        },
-        "chat": {
-            "id": chat.id if chat else None,
-            "type": chat.type if chat else None,
-            "title": chat.title if chat else None,
-            "username": chat.username if chat else None,
-            "first_name": chat.first_name if chat else None,
-            "last_name": chat.last_name if chat else None,
-        },
-        "raw": update.to_dict(),
+                {k: getattr(e, k, None) for k in _ENTITY_FIELDS}
+                for e in msg.entities
+            ] if msg.entities else [],
+        }
+
+    entry = {
+        "timestamp": _utc_timestamp(),
+        "update_id": update.update_id,
+        "message": message,
+        "user": _fields(user, _USER_FIELDS, _NULL_USER),
+        "chat": _fields(chat, _CHAT_FIELDS, _NULL_CHAT),
     }
+    if include_raw:
+        entry["raw"] = update.to_dict()
+    return entry
+
+
+# ── internal helpers ────────────────────────────────────────────────────────
+
+def _fields(obj, names: tuple[str, ...], null: dict) -> dict:
+    """Copy the *names* attributes of *obj*, or a fresh copy of *null* if absent."""
+    if obj is None:
+        return dict(null)
+    return {k: getattr(obj, k, None) for k in names}
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in ``datetime.isoformat()`` layout.
+
+    Same output as ``datetime.now(timezone.utc).isoformat()`` (always with
+    microseconds), but ``strftime`` only runs once per second.
+    """
+    global _ts_cache
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
@@ -17,13 +17,13 @@ Usage
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import logging
 import sys
 from pathlib import Path
 
-import openai
-
 # ── project root on sys.path so 'tools.*' imports work ──────────────────────
 SCRIPT_DIR = Path(__file__).resolve().parent        # tools/openai/
 TOOLS_DIR = SCRIPT_DIR.parent                        # tools/
@@ -31,8 +31,14 @@ PROJECT_ROOT = TOOLS_DIR.parent                      # project root
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from tools.pinecone.client import get_client
 from tools.pinecone.config import PineconeConfig
-from tools.pinecone.index_manager import create_index, describe_index, list_indexes
+from tools.pinecone.embed_cache import EmbedCache
+from tools.pinecone.embeddings import (
+    make_batch_embed_fn as _make_batch_embed_fn,
+    make_embed_fn as _make_embed_fn,
+)
+from tools.pinecone.index_manager import create_index
 from tools.pinecone.parser import parse_docx
 from tools.pinecone.vector_store import VectorStore
 
@@ -42,6 +48,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Last-known index dimensions, so re-runs can skip the control-plane check.
+INDEX_DIMS_FILE = Path.home() / ".cache" / "chatbotai" / "index_dims.json"
+
 
 # ── model definitions ───────────────────────────────────────────────────────
 
@@ -76,10 +85,11 @@ def load_config(config_path: str = None) -> tuple[PineconeConfig, dict]:
             "Copy config.example.json to config.json and fill in your API keys."
         )
 
-    cfg = PineconeConfig.from_json(str(path))
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    return cfg, raw
+    try:
+        raw = json.loads(path.read_bytes())
+    except json.JSONDecodeError as exc:
+        sys.exit(f"ERROR: Invalid JSON in {config_path}: {exc}")
+    return PineconeConfig.from_json_dict(raw, source=str(path)), raw
 
 
 # ── interactive prompts ─────────────────────────────────────────────────────
@@ -132,19 +142,28 @@ def ensure_index(cfg: PineconeConfig, dimension: int) -> None:
 
     - If the index doesn't exist, create it.
     - If it exists but has the wrong dimension, warn and offer to recreate.
+
+    A dimension confirmed on a previous run is remembered in
+    ``INDEX_DIMS_FILE`` and skips the Pinecone round-trip entirely.  A
+    failed upsert drops the remembered entry (see :func:`main`), so an
+    index deleted or recreated outside this script is checked again on
+    the next run.
     """
-    existing = list_indexes(cfg)
+    dims_key = _index_dims_key(cfg)
+    if _load_index_dims().get(dims_key) == dimension:
+        return
 
-    if cfg.index_name not in existing:
+    exists, current_dim = _index_state(cfg.api_key, cfg.index_name)
+
+    if not exists:
         print(f"\nIndex '{cfg.index_name}' does not exist. Creating with dimension={dimension} ...")
         create_index(cfg, dimension=dimension, metric="cosine")
+        _index_state.cache_clear()
+        _save_index_dim(dims_key, dimension)
         return
 
-    # Index exists — check dimension
-    info = describe_index(cfg)
-    current_dim = info.get("dimension")
-
     if current_dim == dimension:
+        _save_index_dim(dims_key, dimension)
         return  # all good
 
     print(f"\n⚠  Dimension mismatch!")
@@ -162,12 +181,57 @@ def ensure_index(cfg: PineconeConfig, dimension: int) -> None:
             delete_index(cfg, skip_confirm=True)
             print(f"\n   Recreating index with dimension={dimension} ...")
             create_index(cfg, dimension=dimension, metric="cosine")
+            _index_state.cache_clear()
+            _save_index_dim(dims_key, dimension)
             return
         if choice == "2":
             sys.exit("Aborted.")
         print("   Invalid choice. Enter 1 or 2.")
 
 
+@functools.lru_cache(maxsize=4)
+def _index_state(api_key: str, index_name: str) -> tuple[bool, int | None]:
+    """Return ``(exists, dimension)`` for an index in one control-plane call."""
+    pc = get_client(PineconeConfig(api_key=api_key, index_name=index_name))
+    for idx in pc.list_indexes():
+        if idx.name == index_name:
+            return True, idx.dimension
+    return False, None
+
+
+def _index_dims_key(cfg: PineconeConfig) -> str:
+    """Key an index by name and (hashed) API key — names are per-project."""
+    account = hashlib.blake2b(cfg.api_key.encode("utf-8"), digest_size=6).hexdigest()
+    return f"{account}/{cfg.index_name}"
+
+
+def _load_index_dims() -> dict[str, int]:
+    try:
+        return json.loads(INDEX_DIMS_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index_dim(key: str, dimension: int) -> None:
+    dims = _load_index_dims()
+    dims[key] = dimension
+    _write_index_dims(dims)
+
+
+def _forget_index_dim(key: str) -> None:
+    dims = _load_index_dims()
+    if dims.pop(key, None) is not None:
+        _write_index_dims(dims)
+
+
+def _write_index_dims(dims: dict[str, int]) -> None:
+    try:
+        INDEX_DIMS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        INDEX_DIMS_FILE.write_text(json.dumps(dims, indent=2), encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Could not save index dimension cache: %s", exc)
+
+
 # ── embedding function ──────────────────────────────────────────────────────
 
 def make_embed_fn(api_key: str, model_name: str):
@@ -180,13 +244,37 @@ def make_embed_fn(api_key: str, model_name: str):
     Returns:
         Callable (str) -> list[float]
     """
-    client = openai.OpenAI(api_key=api_key)
+    return _make_embed_fn(api_key=api_key, model=model_name)
+
+
+def make_embed_batch_fn(
+    api_key: str,
+    model_name: str,
+    batch_size: int = 100,
+    max_concurrency: int = 8,
+    cache: EmbedCache | None = None,
+):
+    """Create a batch embedding function using the OpenAI API.
 
-    def embed(text: str) -> list[float]:
-        response = client.embeddings.create(input=text, model=model_name)
-        return response.data[0].embedding
+    Thin wrapper around :func:`tools.pinecone.embeddings.make_batch_embed_fn`.
 
-    return embed
+    Args:
+        api_key:         OpenAI API key.
+        model_name:      Full model name (e.g. 'text-embedding-3-small').
+        batch_size:      Number of texts per API call.
+        max_concurrency: Maximum concurrent API calls.
+        cache:           Optional embedding cache.
+
+    Returns:
+        Callable (list[str]) -> list[list[float]]
+    """
+    return _make_batch_embed_fn(
+        api_key=api_key,
+        model=model_name,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        cache=cache,
+    )
 
 
 # ── main ────────────────────────────────────────────────────────────────────
@@ -217,6 +305,12 @@ def main() -> None:
         default="config.json",
         help="Path to config.json (default: config.json)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Re-embed every chunk instead of reusing cached embeddings",
+    )
     args = parser.parse_args()
 
     # ── load config ────────────────────────────────────────────────────────
@@ -270,18 +364,33 @@ def main() -> None:
     # ── ensure index exists with correct dimension ─────────────────────────
     ensure_index(cfg, model["dimensions"])
 
-    # ── optionally replace ─────────────────────────────────────────────────
-    store = VectorStore(cfg)
-
-    if args.replace:
-        print("\nReplacing existing vectors ...")
-        store.delete_all(skip_confirm=True)
-
-    # ── embed and upsert ───────────────────────────────────────────────────
-    embed_fn = make_embed_fn(openai_api_key, model["name"])
-
-    print(f"\nEmbedding and upserting {len(chunks)} chunk(s) ...")
-    store.upsert_texts(chunks, embed_fn=embed_fn)
+    try:
+        # ── optionally replace ─────────────────────────────────────────────
+        store = VectorStore(cfg)
+
+        if args.replace:
+            print("\nReplacing existing vectors ...")
+            store.delete_all(skip_confirm=True)
+
+        # ── embed and upsert ───────────────────────────────────────────────
+        cache = None if args.no_cache else EmbedCache()
+        embed_batch_fn = make_embed_batch_fn(openai_api_key, model["name"], cache=cache)
+
+        print(f"\nEmbedding and upserting {len(chunks)} chunk(s) ...")
+        embeddings = embed_batch_fn([c["text"] for c in chunks])
+        store.upsert_vectors([
+            {
+                "id": chunk["id"],
+                "values": values,
+                "metadata": {k: v for k, v in chunk.items() if k != "id"},
+            }
+            for chunk, values in zip(chunks, embeddings)
+        ])
+    except Exception:
+        # The remembered dimension may be stale (index deleted or recreated
+        # elsewhere) — check the index again on the next run.
+        _forget_index_dim(_index_dims_key(cfg))
+        raise
 
     # ── summary ────────────────────────────────────────────────────────────
     stats = store.stats()
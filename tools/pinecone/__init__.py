@@ -35,25 +35,60 @@ CLI usage
     python -m tools.pinecone.cli --help
 """
 
-from tools.pinecone.config import PineconeConfig
-from tools.pinecone.client import get_client, get_index
-from tools.pinecone.index_manager import (
-    create_index,
-    delete_index,
-    describe_index,
-    list_indexes,
-)
-from tools.pinecone.parser import parse_docx, parse_kb_text, parse_txt, parse_csv, parse_file
-from tools.pinecone.vector_store import VectorStore
-from tools.pinecone.embeddings import make_embed_fn, embed_text, embed_batch
-from tools.pinecone.fetch import fetch_vectors, fetch_one, vector_exists
-from tools.pinecone.namespace_manager import (
-    list_namespaces,
-    get_namespace_stats,
-    delete_namespace,
-    copy_namespace,
-)
-from tools.pinecone.backup import export_namespace, import_vectors, export_metadata_only
+import importlib
+
+# Public name → submodule.  Submodules are imported on first attribute
+# access (PEP 562), so ``python -m tools.pinecone.cli`` and light imports
+# such as ``tools.pinecone.config`` don't pull in the Pinecone / OpenAI SDKs.
+_EXPORTS = {
+    "PineconeConfig": "config",
+    "get_client": "client",
+    "get_index": "client",
+    "create_index": "index_manager",
+    "delete_index": "index_manager",
+    "describe_index": "index_manager",
+    "list_indexes": "index_manager",
+    "parse_docx": "parser",
+    "parse_kb_text": "parser",
+    "parse_txt": "parser",
+    "parse_csv": "parser",
+    "parse_file": "parser",
+    "iter_docx": "parser",
+    "iter_kb_text": "parser",
+    "iter_txt": "parser",
+    "iter_csv": "parser",
+    "iter_file": "parser",
+    "VectorStore": "vector_store",
+    "make_embed_fn": "embeddings",
+    "make_batch_embed_fn": "embeddings",
+    "embed_text": "embeddings",
+    "embed_batch": "embeddings",
+    "fetch_vectors": "fetch",
+    "fetch_one": "fetch",
+    "vector_exists": "fetch",
+    "vectors_exist": "fetch",
+    "list_namespaces": "namespace_manager",
+    "get_namespace_stats": "namespace_manager",
+    "delete_namespace": "namespace_manager",
+    "copy_namespace": "namespace_manager",
+    "export_namespace": "backup",
+    "import_vectors": "backup",
+    "export_metadata_only": "backup",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Config & client
@@ -73,14 +108,21 @@ __all__ = [
     "parse_txt",
     "parse_csv",
     "parse_file",
+    "iter_docx",
+    "iter_kb_text",
+    "iter_txt",
+    "iter_csv",
+    "iter_file",
     # Embeddings
     "make_embed_fn",
+    "make_batch_embed_fn",
     "embed_text",
     "embed_batch",
     # Fetch
     "fetch_vectors",
     "fetch_one",
     "vector_exists",
+    "vectors_exist",
     # Namespace management
     "list_namespaces",
     "get_namespace_stats",
@@ -1,4 +1,4 @@
-"""Backup and restore — export/import vectors to/from JSON files.
+"""Backup and restore — export/import vectors to/from JSON or NDJSON files.
 
 Usage
 -----
@@ -10,29 +10,59 @@ Usage
     # Import vectors from a JSON file
     import_vectors(config, "backup.json", namespace="chatbot")
 
+    # Smaller backups — fp16 (near-lossless) or int8 (analysis only)
+    export_namespace(config, "chatbot", "backup.json", precision="fp16")
+
+    # Large namespaces — one vector per line, written as it is fetched
+    export_namespace(config, "chatbot", "backup.ndjson", format="ndjson")
+
 CLI
 ---
     python -m tools.pinecone.cli backup export --file backup.json
+    python -m tools.pinecone.cli backup export --file backup.ndjson --format ndjson
     python -m tools.pinecone.cli backup import --file backup.json
 """
 
 from __future__ import annotations
 
-import json
+import base64
 import logging
+import struct
+from array import array
+from itertools import chain
 from pathlib import Path
+from typing import Iterator, Literal
 
 from tools.pinecone.config import PineconeConfig
 from tools.pinecone.client import get_index
+from tools.pinecone.jsonio import dumps, iter_json_records
+from tools.pinecone.namespace_manager import clear_stats_cache
+from tools.pinecone.utils import (
+    MAX_BATCH_VECTORS,
+    UPSERT_RATE_LIMIT,
+    as_upsert_tuples,
+    chunks,
+    retry_call,
+    run_concurrently,
+    send_upsert,
+    upsert_limiter,
+    vector_batches,
+)
 
 logger = logging.getLogger(__name__)
 
+Precision = Literal["fp32", "fp16", "int8"]
+FileFormat = Literal["json", "ndjson"]
+
 
 def export_namespace(
     config: PineconeConfig,
     namespace: str | None = None,
     output_file: str | Path = "backup.json",
     batch_size: int = 100,
+    precision: Precision = "fp32",
+    max_workers: int = 4,
+    format: FileFormat = "json",
 ) -> int:
     """Export all vectors from a namespace to a JSON file.
 
@@ -46,6 +76,18 @@ def export_namespace(
         Output JSON file path.
     batch_size : int
         Number of vector IDs to fetch per batch.
+    precision : str
+        ``"fp32"`` writes plain ``values`` lists.  ``"fp16"`` and ``"int8"``
+        write base64-encoded ``values_b64`` plus a ``dtype`` tag (and a
+        per-vector ``scale`` for int8) — 2× / 4× smaller than fp32 bytes
+        and far smaller than JSON floats.  fp16 is accurate enough to
+        restore from; int8 is meant for offline analysis.
+    max_workers : int
+        Concurrent fetch requests per listed page.
+    format : str
+        ``"json"`` writes one indented JSON array.  ``"ndjson"`` writes one
+        vector per line as each page is fetched, so memory use stays flat
+        however large the namespace is.
 
     Returns
     -------
@@ -54,74 +96,65 @@ def export_namespace(
     """
     index = get_index(config)
     ns = namespace or config.namespace
-    out = Path(output_file)
-
-    all_vectors: list[dict] = []
-    pagination_token = None
 
     logger.info("Exporting namespace '%s' ...", ns)
 
-    while True:
-        list_kwargs = {"namespace": ns, "limit": batch_size}
-        if pagination_token:
-            list_kwargs["pagination_token"] = pagination_token
+    def entries() -> Iterator[dict]:
+        total = 0
+        for page in _iter_pages(index, ns, batch_size, max_workers):
+            for vec_id, vec_data in page.items():
+                entry = {"id": vec_id}
+                entry.update(_encode_values(vec_data.get("values", []), precision))
+                entry["metadata"] = vec_data.get("metadata", {})
+                yield entry
+            total += len(page)
+            logger.info("Fetched %d vectors (%d total)", len(page), total)
 
-        list_response = index.list(**list_kwargs)
-        vec_ids = [v for v in (list_response.get("vectors", []) or [])]
-
-        if not vec_ids:
-            break
-
-        fetch_response = index.fetch(ids=vec_ids, namespace=ns)
-        vectors_data = fetch_response.get("vectors", {})
-
-        for vec_id, vec_data in vectors_data.items():
-            all_vectors.append({
-                "id": vec_id,
-                "values": vec_data.get("values", []),
-                "metadata": vec_data.get("metadata", {}),
-            })
-
-        logger.info("Fetched %d vectors (%d total)", len(vectors_data), len(all_vectors))
-
-        pagination_token = list_response.get("pagination", {}).get("next")
-        if not pagination_token:
-            break
-
-    # Write to file
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(
-        json.dumps(all_vectors, indent=2, ensure_ascii=False, default=str),
-        encoding="utf-8",
-    )
-    logger.info("Exported %d vector(s) to %s", len(all_vectors), out)
-    return len(all_vectors)
+    count = _write_records(Path(output_file), entries(), format)
+    logger.info("Exported %d vector(s) to %s", count, output_file)
+    return count
 
 
 def import_vectors(
     config: PineconeConfig,
     input_file: str | Path,
     namespace: str | None = None,
-    batch_size: int = 100,
+    batch_size: int = MAX_BATCH_VECTORS,
     replace: bool = False,
+    max_workers: int = 8,
+    upsert_rate_limit: float | None = UPSERT_RATE_LIMIT,
 ) -> int:
-    """Import vectors from a JSON file into Pinecone.
+    """Import vectors from a JSON or NDJSON file into Pinecone.
+
+    The file should contain a JSON list of dicts (or one dict per line),
+    each with ``id``, ``values``, and optionally ``metadata``.  Quantized entries
+    written by ``export_namespace(precision=...)`` are detected by their
+    ``dtype`` tag and decoded back to float values.
 
-    The JSON file should contain a list of dicts, each with
-    ``id``, ``values``, and optionally ``metadata``.
+    The file is streamed (JSON arrays with ``ijson`` when installed), so
+    memory use is bounded by the in-flight batches rather than the file
+    size.
 
     Parameters
     ----------
     config : PineconeConfig
         Pinecone connection settings.
     input_file : str | Path
-        Path to the JSON file.
+        Path to the JSON or NDJSON file (detected from its first byte).
     namespace : str | None
         Target namespace (defaults to config.namespace).
     batch_size : int
-        Number of vectors per upsert batch.
+        Maximum vectors per upsert batch.  Batches are also capped at
+        Pinecone's 2 MB request size.
     replace : bool
-        If *True*, delete all existing vectors in the namespace first.
+        If *True*, delete all existing vectors in the namespace first —
+        once the first batch of the file has parsed, so an unreadable
+        file leaves the namespace untouched.
+    max_workers : int
+        Number of upsert requests kept in flight concurrently.
+    upsert_rate_limit : float | None
+        Upsert throughput ceiling in bytes/s (``None`` for no limit).
+        Throttled requests are retried with backoff.
 
     Returns
     -------
@@ -130,23 +163,30 @@ def import_vectors(
     """
     index = get_index(config)
     ns = namespace or config.namespace
-    path = Path(input_file)
+    items = iter_json_records(input_file)
+    batches = vector_batches(map(_decode_values, items), max_vectors=batch_size)
 
-    data = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(data, list):
-        raise ValueError(f"Expected a JSON array, got {type(data).__name__}")
+    # Parse the first batch before deleting anything, so a malformed or
+    # wrong-format file fails with the namespace still intact.
+    first = next(batches, None)
+    if first is not None:
+        batches = chain([first], batches)
 
     if replace:
         logger.info("Replacing — deleting all vectors in namespace '%s'", ns)
-        index.delete(delete_all=True, namespace=ns)
+        retry_call(index.delete, delete_all=True, namespace=ns)
+
+    limiter = upsert_limiter(upsert_rate_limit)
+
+    def upsert(batch: list[dict]) -> int:
+        return send_upsert(index, as_upsert_tuples(batch), ns, limiter)
 
     imported = 0
-    for i in range(0, len(data), batch_size):
-        batch = data[i : i + batch_size]
-        index.upsert(vectors=batch, namespace=ns)
-        imported += len(batch)
-        logger.info("Imported batch %d–%d of %d", i + 1, i + len(batch), len(data))
+    for count in run_concurrently(upsert, batches, max_workers=max_workers):
+        imported += count
+        logger.info("Imported %d vector(s) (%d total)", count, imported)
 
+    clear_stats_cache(config.index_name)
     logger.info("Imported %d vector(s) into namespace '%s'", imported, ns)
     return imported
 
@@ -156,6 +196,8 @@ def export_metadata_only(
     namespace: str | None = None,
     output_file: str | Path = "metadata_backup.json",
     batch_size: int = 100,
+    max_workers: int = 4,
+    format: FileFormat = "json",
 ) -> int:
     """Export only metadata (no vectors) for a lighter backup.
 
@@ -172,6 +214,10 @@ def export_metadata_only(
         Output JSON file path.
     batch_size : int
         IDs per fetch batch.
+    max_workers : int
+        Concurrent fetch requests per listed page.
+    format : str
+        ``"json"`` (indented array) or ``"ndjson"`` (one entry per line).
 
     Returns
     -------
@@ -180,39 +226,119 @@ def export_metadata_only(
     """
     index = get_index(config)
     ns = namespace or config.namespace
-    out = Path(output_file)
 
-    all_entries: list[dict] = []
+    entries = (
+        {"id": vec_id, "metadata": vec_data.get("metadata", {})}
+        for page in _iter_pages(index, ns, batch_size, max_workers)
+        for vec_id, vec_data in page.items()
+    )
+
+    count = _write_records(Path(output_file), entries, format)
+    logger.info("Exported metadata for %d vector(s) to %s", count, output_file)
+    return count
+
+
+# ── internal helpers ────────────────────────────────────────────────────────
+
+def _iter_pages(index, namespace: str, batch_size: int, max_workers: int) -> Iterator[dict]:
+    """Yield ``{id: vector}`` dicts for each listed page of *namespace*."""
     pagination_token = None
 
     while True:
-        list_kwargs = {"namespace": ns, "limit": batch_size}
+        list_kwargs = {"namespace": namespace, "limit": batch_size}
         if pagination_token:
             list_kwargs["pagination_token"] = pagination_token
 
         list_response = index.list(**list_kwargs)
-        vec_ids = [v for v in (list_response.get("vectors", []) or [])]
+        vec_ids = list_response.get("vectors", []) or []
 
         if not vec_ids:
             break
 
-        fetch_response = index.fetch(ids=vec_ids, namespace=ns)
-        vectors_data = fetch_response.get("vectors", {})
-
-        for vec_id, vec_data in vectors_data.items():
-            all_entries.append({
-                "id": vec_id,
-                "metadata": vec_data.get("metadata", {}),
-            })
+        yield _fetch_page(index, vec_ids, namespace, max_workers)
 
         pagination_token = list_response.get("pagination", {}).get("next")
         if not pagination_token:
             break
 
+
+def _write_records(out: Path, records: Iterator[dict], format: FileFormat) -> int:
+    """Write *records* to *out* as a JSON array or NDJSON; return the count."""
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(
-        json.dumps(all_entries, indent=2, ensure_ascii=False, default=str),
-        encoding="utf-8",
-    )
-    logger.info("Exported metadata for %d vector(s) to %s", len(all_entries), out)
-    return len(all_entries)
+
+    if format == "json":
+        entries = list(records)
+        out.write_bytes(dumps(entries, indent=True))
+        return len(entries)
+
+    if format == "ndjson":
+        count = 0
+        with out.open("wb") as f:
+            for record in records:
+                f.write(dumps(record) + b"\n")
+                count += 1
+        return count
+
+    raise ValueError(f"Unknown format '{format}'. Use json or ndjson.")
+
+
+def _fetch_page(index, ids: list[str], namespace: str, max_workers: int) -> dict:
+    """Fetch one listed page of IDs as concurrent sub-batches.
+
+    The page is split into *max_workers* roughly equal parts so the fetch
+    latency is that of one small request rather than one large one.
+    """
+    part_size = max(1, -(-len(ids) // max(1, max_workers)))
+
+    def fetch(part: list[str]) -> dict:
+        return index.fetch(ids=part, namespace=namespace).get("vectors", {})
+
+    vectors: dict = {}
+    for part_vectors in run_concurrently(fetch, chunks(ids, part_size), max_workers):
+        vectors.update(part_vectors)
+    return vectors
+
+
+# ── quantization ────────────────────────────────────────────────────────────
+
+def _encode_values(values: list[float], precision: Precision) -> dict:
+    """Return the backup-file fields for *values* at the given precision."""
+    if precision == "fp32":
+        return {"values": values}
+
+    if precision == "fp16":
+        raw = struct.pack(f"<{len(values)}e", *values)
+        return {"dtype": "fp16", "values_b64": base64.b64encode(raw).decode("ascii")}
+
+    if precision == "int8":
+        peak = max((abs(v) for v in values), default=0.0)
+        scale = peak / 127 if peak else 1.0
+        quantized = array("b", (round(v / scale) for v in values))
+        return {
+            "dtype": "int8",
+            "scale": scale,
+            "values_b64": base64.b64encode(quantized.tobytes()).decode("ascii"),
+        }
+
+    raise ValueError(f"Unknown precision '{precision}'. Use fp32, fp16, or int8.")
+
+
+def _decode_values(entry: dict) -> dict:
+    """Turn a (possibly quantized) backup entry into an upsert-ready vector."""
+    dtype = entry.get("dtype")
+    if dtype is None:
+        return entry
+
+    raw = base64.b64decode(entry["values_b64"])
+    if dtype == "fp16":
+        values = list(struct.unpack(f"<{len(raw) // 2}e", raw))
+    elif dtype == "int8":
+        scale = entry["scale"]
+        values = [q * scale for q in array("b", raw)]
+    else:
+        raise ValueError(f"Unknown dtype '{dtype}' for vector '{entry.get('id')}'")
+
+    vector = {"id": entry["id"], "values": values}
+    if "metadata" in entry:
+        vector["metadata"] = entry["metadata"]
+    return vector
@@ -14,10 +14,16 @@ Usage
     python -m tools.pinecone.cli vectors upsert --file knowledgebase.docx
     python -m tools.pinecone.cli vectors upsert --file data.txt
     python -m tools.pinecone.cli vectors upsert --file data.csv
-    python -m tools.pinecone.cli vectors upsert --file knowledgebase.docx --replace
+    python -m tools.pinecone.cli vectors upsert --file knowledgebase.docx --replace --yes
+    python -m tools.pinecone.cli vectors upsert --file knowledgebase.docx --incremental
+    python -m tools.pinecone.cli vectors upsert --file knowledgebase.docx --batch-api
+    python -m tools.pinecone.cli vectors upsert --file data.json --batch-size 200 --parallel 16
+    python -m tools.pinecone.cli --quiet vectors upsert --file data.json
     python -m tools.pinecone.cli vectors fetch --ids vec-1 vec-2
+    python -m tools.pinecone.cli vectors fetch --ids vec-1 vec-2 --no-values --ndjson
     python -m tools.pinecone.cli vectors query --text "search terms" --top-k 5
     python -m tools.pinecone.cli vectors query --text "search" --filter '{"type": {"$eq": "faq"}}'
+    python -m tools.pinecone.cli vectors query-batch --text-file queries.txt --parallel 16
     python -m tools.pinecone.cli vectors delete --ids vec-1 vec-2
     python -m tools.pinecone.cli vectors delete-all --yes
     python -m tools.pinecone.cli vectors update-metadata --id vec-1 --metadata '{"text": "new"}'
@@ -31,6 +37,8 @@ Usage
     # Backup & restore
     python -m tools.pinecone.cli backup export --file backup.json
     python -m tools.pinecone.cli backup export --file metadata.json --metadata-only
+    python -m tools.pinecone.cli backup export --file backup.json --precision fp16
+    python -m tools.pinecone.cli backup export --file backup.ndjson --format ndjson
     python -m tools.pinecone.cli backup import --file backup.json
     python -m tools.pinecone.cli backup import --file backup.json --replace
 
@@ -45,20 +53,22 @@ Supported file formats for upsert
 from __future__ import annotations
 
 import argparse
-import json
+import itertools
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from tools.pinecone.config import PineconeConfig
-from tools.pinecone.index_manager import (
-    create_index,
-    delete_index,
-    describe_index,
-    list_indexes,
-)
-from tools.pinecone.vector_store import VectorStore
-from tools.pinecone.embeddings import make_embed_fn as _make_embed_fn
+from tools.pinecone.jsonio import JSONDecodeError, dumps, iter_json_array, loads
+
+# --batch-api only pays off for large uploads; smaller ones embed directly.
+BATCH_API_MIN_TEXTS = 500
+
+# Heavy modules (Pinecone / OpenAI SDKs) are imported inside the command
+# branches that need them, so trivial commands start quickly.
+if TYPE_CHECKING:
+    from tools.pinecone.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +78,16 @@ _PROJECT_CONFIG = _PROJECT_ROOT / "_config files" / "config.json"
 
 # ── argument parser ─────────────────────────────────────────────────────────
 
-def _build_parser() -> argparse.ArgumentParser:
+# Root options that consume the following token as their value.
+_VALUE_OPTIONS = ("--config", "--env-file", "--namespace")
+
+
+def _build_parser(group: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    If *group* is given, only that command group's sub-commands are built —
+    the rest of the tree is never constructed.  ``None`` builds everything.
+    """
     root = argparse.ArgumentParser(
         prog="pinecone-tools",
         description="Reusable Pinecone toolkit — index, vector, namespace, and backup operations.",
@@ -89,9 +108,47 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override the PINECONE_NAMESPACE env var for this run",
     )
+    root.add_argument(
+        "--grpc",
+        action="store_true",
+        help="Talk to Pinecone over gRPC (faster bulk upserts; needs pinecone[grpc])",
+    )
+    root.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Only log warnings and errors",
+    )
 
     sub = root.add_subparsers(dest="group", required=True)
 
+    builders = _GROUP_BUILDERS if group is None else {group: _GROUP_BUILDERS[group]}
+    for build in builders.values():
+        build(sub)
+
+    return root
+
+
+def _requested_group(argv: list[str]) -> str | None:
+    """Return the command group named in *argv*, or ``None`` to build all.
+
+    Falls back to the full parser when help is requested or no known group
+    is found, so usage and error messages stay complete.
+    """
+    if "-h" in argv or "--help" in argv:
+        return None
+    prev = ""
+    for token in argv:
+        takes_value = (
+            prev.startswith("--") and "=" not in prev
+            and any(opt.startswith(prev) for opt in _VALUE_OPTIONS)
+        )
+        if token in _GROUP_BUILDERS and not takes_value:
+            return token
+        prev = token
+    return None
+
+
+def _add_index_commands(sub) -> None:
     # ── index sub-commands ─────────────────────────────────────────────────
     idx = sub.add_parser("index", help="Manage Pinecone indexes")
     idx_sub = idx.add_subparsers(dest="action", required=True)
@@ -108,6 +165,8 @@ def _build_parser() -> argparse.ArgumentParser:
     idx_sub.add_parser("list", help="List all indexes")
     idx_sub.add_parser("describe", help="Describe the configured index")
 
+
+def _add_vector_commands(sub) -> None:
     # ── vector sub-commands ────────────────────────────────────────────────
     vec = sub.add_parser("vectors", help="Vector operations")
     vec_sub = vec.add_subparsers(dest="action", required=True)
@@ -122,14 +181,31 @@ def _build_parser() -> argparse.ArgumentParser:
                           help="Embedding provider for text-based upsert (default: openai)")
     p_upsert.add_argument("--embed-model", default="text-embedding-3-small",
                           help="Embedding model name (default: text-embedding-3-small)")
-    p_upsert.add_argument("--replace", action="store_true", default=False,
-                          help="Delete all existing vectors in the namespace before upserting")
+    upsert_mode = p_upsert.add_mutually_exclusive_group()
+    upsert_mode.add_argument("--replace", action="store_true", default=False,
+                             help="Delete all existing vectors in the namespace before upserting")
+    upsert_mode.add_argument("--incremental", action="store_true", default=False,
+                             help="Skip text chunks upserted before with unchanged content "
+                                  "(tracked in ~/.cache/chatbotai/cache.db)")
+    p_upsert.add_argument("--batch-size", type=int, default=100,
+                          help="Vectors per upsert request (default: 100)")
+    p_upsert.add_argument("--parallel", type=int, default=8,
+                          help="Concurrent upsert batches (default: 8)")
+    p_upsert.add_argument("--batch-api", action="store_true", default=False,
+                          help="Embed large text uploads via the OpenAI Batch API "
+                               "(half price, may take up to 24 h)")
+    p_upsert.add_argument("--no-cache", action="store_true", default=False,
+                          help="Re-embed every text instead of using the on-disk embedding cache")
+    p_upsert.add_argument("--yes", "-y", action="store_true", default=False,
+                          help="Skip the --replace confirmation prompt")
 
     p_fetch = vec_sub.add_parser("fetch", help="Fetch vectors by ID")
     p_fetch.add_argument("--ids", nargs="+", required=True,
                          help="Vector IDs to fetch")
     p_fetch.add_argument("--no-values", action="store_true", default=False,
                          help="Omit embedding values from output")
+    p_fetch.add_argument("--ndjson", action="store_true", default=False,
+                         help="Print one compact JSON object per line instead of a JSON array")
 
     p_query = vec_sub.add_parser("query", help="Semantic search with text")
     p_query.add_argument("--text", required=True,
@@ -143,6 +219,22 @@ def _build_parser() -> argparse.ArgumentParser:
     p_query.add_argument("--min-score", type=float, default=0.0,
                          help="Minimum similarity score to show (default: 0.0)")
 
+    p_qbatch = vec_sub.add_parser("query-batch",
+                                  help="Semantic search for many queries at once")
+    p_qbatch.add_argument("--text-file", required=True,
+                          help="File with one query per line")
+    p_qbatch.add_argument("--top-k", type=int, default=5,
+                          help="Number of results per query (default: 5)")
+    p_qbatch.add_argument("--filter", default=None,
+                          help="JSON metadata filter applied to every query")
+    p_qbatch.add_argument("--embed-model", default="text-embedding-3-small")
+    p_qbatch.add_argument("--min-score", type=float, default=0.0,
+                          help="Minimum similarity score to show (default: 0.0)")
+    p_qbatch.add_argument("--parallel", type=int, default=8,
+                          help="Concurrent query requests (default: 8)")
+    p_qbatch.add_argument("--no-cache", action="store_true", default=False,
+                          help="Re-embed every query instead of using the on-disk embedding cache")
+
     p_del = vec_sub.add_parser("delete", help="Delete vectors by ID")
     p_del.add_argument("--ids", nargs="+", required=True,
                        help="Vector IDs to delete")
@@ -155,6 +247,8 @@ def _build_parser() -> argparse.ArgumentParser:
     p_meta.add_argument("--metadata", required=True,
                         help="JSON string of metadata to set")
 
+
+def _add_namespace_commands(sub) -> None:
     # ── namespace sub-commands ─────────────────────────────────────────────
     ns_parser = sub.add_parser("namespace", help="Namespace operations")
     ns_sub = ns_parser.add_subparsers(dest="action", required=True)
@@ -176,6 +270,8 @@ def _build_parser() -> argparse.ArgumentParser:
     p_ns_copy.add_argument("--to", dest="target_ns", required=True,
                            help="Target namespace")
 
+
+def _add_backup_commands(sub) -> None:
     # ── backup sub-commands ────────────────────────────────────────────────
     bk = sub.add_parser("backup", help="Backup & restore operations")
     bk_sub = bk.add_subparsers(dest="action", required=True)
@@ -184,27 +280,39 @@ def _build_parser() -> argparse.ArgumentParser:
     p_export.add_argument("--file", required=True, help="Output JSON file path")
     p_export.add_argument("--metadata-only", action="store_true", default=False,
                           help="Export metadata only (no embedding values)")
-
-    p_import = bk_sub.add_parser("import", help="Import vectors from a JSON file")
-    p_import.add_argument("--file", required=True, help="Input JSON file path")
+    p_export.add_argument("--precision", default="fp32",
+                          choices=["fp32", "fp16", "int8"],
+                          help="Stored value precision (default: fp32)")
+    p_export.add_argument("--format", default="json", choices=["json", "ndjson"],
+                          help="Output format; ndjson streams one vector per line (default: json)")
+
+    p_import = bk_sub.add_parser("import", help="Import vectors from a JSON or NDJSON file")
+    p_import.add_argument("--file", required=True,
+                          help="Input JSON or NDJSON file path (format is auto-detected)")
     p_import.add_argument("--replace", action="store_true", default=False,
                           help="Delete all existing vectors before importing")
 
-    return root
+
+_GROUP_BUILDERS = {
+    "index": _add_index_commands,
+    "vectors": _add_vector_commands,
+    "namespace": _add_namespace_commands,
+    "backup": _add_backup_commands,
+}
 
 
 # ── upsert handlers ────────────────────────────────────────────────────────
 
 def _handle_upsert(store: VectorStore, args, json_config: dict | None = None) -> None:
     """Route upsert to the right handler based on file extension."""
-    from tools.pinecone.parser import parse_file
+    from tools.pinecone.parser import iter_file
 
     file_path = Path(args.file)
     ext = file_path.suffix.lower()
 
     # Optionally wipe the namespace first
-    if args.replace:
-        store.delete_all(skip_confirm=False)
+    if args.replace and not store.delete_all(skip_confirm=args.yes):
+        _aborted("Namespace not wiped, nothing upserted")
 
     # Resolve OpenAI settings from JSON config (if available)
     openai_cfg = (json_config or {}).get("openai", {})
@@ -214,13 +322,18 @@ def _handle_upsert(store: VectorStore, args, json_config: dict | None = None) ->
     if ext == ".json":
         _upsert_json(store, args, embed_model, openai_api_key)
     elif ext in (".docx", ".txt", ".csv"):
-        chunks = parse_file(str(file_path))
-        if not chunks:
+        # Chunks are parsed lazily and upserted --batch-size at a time
+        parsed = iter_file(file_path)
+        first = next(parsed, None)
+        if first is None:
             sys.exit(f"ERROR: No valid chunks found in {file_path}")
-        logger.info("Parsed %d chunk(s) from %s — embedding and upserting ...", len(chunks), file_path.name)
-        embed_fn = _make_embed_fn(api_key=openai_api_key, model=embed_model)
-        store.upsert_texts(chunks, embed_fn=embed_fn)
-        logger.info("Done. Upserted %d chunk(s).", len(chunks))
+        parsed = itertools.chain([first], parsed)
+        logger.info("Parsing %s — embedding and upserting ...", file_path.name)
+        embed_fn, parsed = _text_embed_fn(args, openai_api_key, embed_model, parsed)
+        total = _upsert_text_batches(
+            store, parsed, embed_fn, args.batch_size, args.parallel, args.incremental,
+        )
+        logger.info("Done. Upserted %d chunk(s).", total)
     else:
         sys.exit(f"ERROR: Unsupported file format '{ext}'. Use .json, .docx, .txt, or .csv.")
 
@@ -231,68 +344,228 @@ def _upsert_json(
     embed_model: str,
     openai_api_key: str | None = None,
 ) -> None:
-    """Upsert from a JSON file (pre-computed vectors or text)."""
-    with open(args.file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if not isinstance(data, list):
+    """Upsert from a JSON file (pre-computed vectors or text).
+
+    Items are streamed from the file and upserted ``--batch-size`` at a
+    time, so memory use does not grow with the file size.
+    """
+    try:
+        items = iter_json_array(args.file)
+    except ValueError:
         sys.exit("ERROR: JSON file must contain a top-level array.")
 
-    if not data:
+    first = next(items, None)
+    if first is None:
         sys.exit("ERROR: JSON file is empty.")
+    items = itertools.chain([first], items)
 
     # Pre-computed vectors (items have "values" key)
-    if "values" in data[0]:
-        store.upsert_vectors(data)
+    if "values" in first:
+        total = _upsert_vector_batches(store, items, args.batch_size, args.parallel)
     # Text-based (items have "text" key — embed automatically)
-    elif "text" in data[0]:
-        logger.info("Detected text-based JSON — embedding and upserting %d item(s) ...", len(data))
-        embed_fn = _make_embed_fn(api_key=openai_api_key, model=embed_model)
-        store.upsert_texts(data, embed_fn=embed_fn)
-        logger.info("Done. Upserted %d item(s).", len(data))
+    elif "text" in first:
+        logger.info("Detected text-based JSON — embedding and upserting ...")
+        embed_fn, items = _text_embed_fn(args, openai_api_key, embed_model, items)
+        total = _upsert_text_batches(
+            store, items, embed_fn, args.batch_size, args.parallel, args.incremental,
+        )
     else:
         sys.exit(
             "ERROR: JSON items must have either 'values' (pre-computed vectors) "
             "or 'text' (to be embedded)."
         )
+    logger.info("Done. Upserted %d item(s).", total)
+
+
+def _text_embed_fn(args, api_key: str | None, model: str, items):
+    """Return ``(batch_embed_fn, items)`` for a text upsert.
+
+    Normally a streaming batch embed function.  With ``--batch-api`` and at
+    least ``BATCH_API_MIN_TEXTS`` items, every text is embedded up front in
+    one OpenAI Batch API job and the returned function looks vectors up;
+    *items* is materialised to a list in that case.
+    """
+    from tools.pinecone.embeddings import (
+        embed_batch_api,
+        make_batch_embed_fn,
+        resolve_model_name,
+    )
+
+    cache = _embed_cache(args)
+    if args.batch_api:
+        items = list(items)
+        if len(items) >= BATCH_API_MIN_TEXTS:
+            model = resolve_model_name(model)
+            texts = list(dict.fromkeys(item["text"] for item in items))
+
+            def compute(missing: list[str]) -> list[list[float]]:
+                return embed_batch_api(missing, api_key=api_key, model=model)
+
+            vectors = cache.get_or_compute_many(texts, model, compute) if cache else compute(texts)
+            by_text = dict(zip(texts, vectors))
+            return (lambda batch: [by_text[t] for t in batch]), items
+        logger.info(
+            "Only %d text(s) — below the Batch API threshold of %d, embedding directly.",
+            len(items), BATCH_API_MIN_TEXTS,
+        )
+
+    return make_batch_embed_fn(api_key=api_key, model=model, cache=cache), items
+
+
+def _upsert_vector_batches(store: VectorStore, vectors, batch_size: int, parallel: int) -> int:
+    """Upsert pre-computed vectors in *batch_size* requests, *parallel* at a time."""
+    return store.upsert_vectors(vectors, max_workers=parallel, batch_size=batch_size)
+
+
+def _upsert_text_batches(
+    store: VectorStore,
+    items,
+    embed_fn,
+    batch_size: int,
+    parallel: int,
+    incremental: bool = False,
+) -> int:
+    """Embed and upsert text items through one :meth:`VectorStore.upsert_texts_batched` pipeline.
+
+    *embed_fn* is a batch embedding function — each *batch_size* batch is
+    embedded in a single API call, with up to *parallel* upsert requests
+    in flight.  With *incremental*, items the store's upsert ledger has
+    recorded with the same content are skipped without being embedded.
+    """
+    return store.upsert_texts_batched(
+        items, batch_embed_fn=embed_fn, batch_size=batch_size,
+        max_workers=parallel, skip_unchanged=incremental,
+    )
+
+
+def _handle_query_batch(store: VectorStore, args, json_config: dict) -> None:
+    """Run every query in ``--text-file`` through :meth:`VectorStore.query_batch`."""
+    from tools.pinecone.embeddings import make_batch_embed_fn
+
+    with open(args.text_file, encoding="utf-8") as f:
+        texts = [line.strip() for line in f if line.strip()]
+    if not texts:
+        sys.exit(f"ERROR: No queries found in {args.text_file}")
+
+    openai_cfg = json_config.get("openai", {})
+    embed_many = make_batch_embed_fn(
+        api_key=openai_cfg.get("api_key"),
+        model=openai_cfg.get("embedding_model") or args.embed_model,
+        cache=_embed_cache(args),
+    )
+    filter_dict = _parse_json_arg(args.filter, "--filter") if args.filter else None
+    results = store.query_batch(
+        texts, top_k=args.top_k, filter=filter_dict,
+        batch_embed_fn=embed_many, max_workers=args.parallel,
+    )
+
+    for text, matches in zip(texts, results):
+        print(text)
+        shown = [m for m in matches if m["score"] >= args.min_score]
+        for match in shown:
+            preview = match["metadata"].get("text", "")
+            preview = preview[:100] + "..." if len(preview) > 100 else preview
+            print(f"  [{match['score']:.4f}] {match['id']}: {preview}")
+        if not shown:
+            print("  (no matches)")
+
+
+def _aborted(what: str) -> None:
+    """Exit non-zero after a declined confirmation prompt."""
+    sys.exit(f"Aborted: {what}. Pass --yes to confirm without a prompt.")
+
+
+def _forget_upserts(cfg: PineconeConfig, namespace: str | None = None) -> None:
+    """Drop upsert-ledger records made stale by a write outside :class:`VectorStore`.
+
+    With *namespace* ``None``, every namespace of the index is forgotten.
+    """
+    from tools.pinecone.upsert_ledger import UpsertLedger
+
+    ledger = UpsertLedger()
+    try:
+        if namespace is None:
+            ledger.forget_index(cfg.index_name)
+        else:
+            ledger.forget(UpsertLedger.scope(cfg.index_name, namespace))
+    finally:
+        ledger.close()
+
+
+def _embed_cache(args):
+    """Return the on-disk embedding cache unless ``--no-cache`` was given."""
+    if args.no_cache:
+        return None
+    from tools.pinecone.embed_cache import EmbedCache
+    return EmbedCache()
+
+
+def _read_config(path: str) -> dict:
+    """Read and parse a JSON config file once, exiting with a message on error."""
+    try:
+        return loads(Path(path).read_bytes())
+    except FileNotFoundError:
+        sys.exit(f"ERROR: Config file not found: {path}")
+    except JSONDecodeError as exc:
+        sys.exit(f"ERROR: Invalid JSON in {path}: {exc}")
+
+
+def _parse_json_arg(value: str, flag: str):
+    """Parse a JSON command-line argument, exiting with a message if invalid."""
+    try:
+        return loads(value)
+    except JSONDecodeError as exc:
+        sys.exit(f"ERROR: {flag} is not valid JSON: {exc}")
 
 
 # ── main ────────────────────────────────────────────────────────────────────
 
 def main() -> None:
+    parser = _build_parser(_requested_group(sys.argv[1:]))
+    args = parser.parse_args()
+
+    # Timestamps only for interactive use — redirected output (CI, shell
+    # loops) gets a cheaper format without per-record strftime.
     logging.basicConfig(
-        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-        level=logging.INFO,
+        format=(
+            "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
+            if sys.stderr.isatty() else "%(levelname)s %(message)s"
+        ),
+        level=logging.WARNING if args.quiet else logging.INFO,
     )
 
-    parser = _build_parser()
-    args = parser.parse_args()
-
     # ── load config ───────────────────────────────────────────────────────
     _json_config = {}  # raw JSON data for non-Pinecone keys (e.g. openai)
 
-    if args.config:
-        cfg = PineconeConfig.from_json(args.config)
-        with open(args.config, "r", encoding="utf-8") as f:
-            _json_config = json.load(f)
-    elif args.env_file:
-        cfg = PineconeConfig.from_env(env_file=args.env_file)
-    elif _PROJECT_CONFIG.exists():
-        cfg = PineconeConfig.from_json(str(_PROJECT_CONFIG))
-        with open(_PROJECT_CONFIG, "r", encoding="utf-8") as f:
-            _json_config = json.load(f)
+    config_file = args.config or (
+        str(_PROJECT_CONFIG) if not args.env_file and _PROJECT_CONFIG.exists() else None
+    )
+    if config_file:
+        _json_config = _read_config(config_file)
+        cfg = PineconeConfig.from_json_dict(_json_config, source=config_file)
     else:
-        cfg = PineconeConfig.from_env()
+        cfg = PineconeConfig.from_env(env_file=args.env_file)
 
     if args.namespace:
         cfg.namespace = args.namespace
+    if args.grpc:
+        cfg.use_grpc = True
 
     # ── index commands ─────────────────────────────────────────────────────
     if args.group == "index":
+        from tools.pinecone.index_manager import (
+            create_index,
+            delete_index,
+            describe_index,
+            list_indexes,
+        )
+
         if args.action == "create":
             create_index(cfg, dimension=args.dimension, metric=args.metric)
         elif args.action == "delete":
-            delete_index(cfg, skip_confirm=args.yes)
+            if not delete_index(cfg, skip_confirm=args.yes):
+                _aborted("Index not deleted")
+            _forget_upserts(cfg)
         elif args.action == "list":
             names = list_indexes(cfg)
             for n in names:
@@ -306,7 +579,12 @@ def main() -> None:
 
     # ── vector commands ────────────────────────────────────────────────────
     elif args.group == "vectors":
-        store = VectorStore(cfg)
+        from tools.pinecone.upsert_ledger import UpsertLedger
+        from tools.pinecone.vector_store import VectorStore
+
+        # The ledger tracks every text upsert and delete made here, so
+        # ``upsert --incremental`` knows which chunks are unchanged.
+        store = VectorStore(cfg, ledger=UpsertLedger())
 
         if args.action == "stats":
             s = store.stats()
@@ -321,21 +599,28 @@ def main() -> None:
 
         elif args.action == "fetch":
             results = store.fetch(args.ids)
-            for vec in results:
-                entry = {"id": vec["id"], "metadata": vec["metadata"]}
-                if not args.no_values:
-                    entry["values"] = vec["values"]
-                print(json.dumps(entry, indent=2, default=str))
+            entries = [
+                {"id": v["id"], "metadata": v["metadata"]}
+                if args.no_values else
+                {"id": v["id"], "metadata": v["metadata"], "values": v["values"]}
+                for v in results
+            ]
+            if args.ndjson:
+                out = b"".join(dumps(e) + b"\n" for e in entries)
+            else:
+                out = dumps(entries, indent=True) + b"\n"
+            sys.stdout.buffer.write(out)
 
         elif args.action == "query":
             openai_cfg = _json_config.get("openai", {})
             api_key = openai_cfg.get("api_key")
             model = openai_cfg.get("embedding_model") or args.embed_model
 
+            from tools.pinecone.embeddings import make_embed_fn as _make_embed_fn
             embed_fn = _make_embed_fn(api_key=api_key, model=model)
             store_with_embed = VectorStore(cfg, embed_fn=embed_fn)
 
-            filter_dict = json.loads(args.filter) if args.filter else None
+            filter_dict = _parse_json_arg(args.filter, "--filter") if args.filter else None
             results = store_with_embed.query_text(
                 args.text, top_k=args.top_k, filter=filter_dict,
             )
@@ -350,14 +635,18 @@ def main() -> None:
             if not results:
                 print("  (no matches)")
 
+        elif args.action == "query-batch":
+            _handle_query_batch(store, args, _json_config)
+
         elif args.action == "delete":
             store.delete_vectors(args.ids)
 
         elif args.action == "delete-all":
-            store.delete_all(skip_confirm=args.yes)
+            if not store.delete_all(skip_confirm=args.yes):
+                _aborted("Nothing deleted")
 
         elif args.action == "update-metadata":
-            metadata = json.loads(args.metadata)
+            metadata = _parse_json_arg(args.metadata, "--metadata")
             store.update_metadata(args.id, metadata)
 
     # ── namespace commands ──────────────────────────────────────────────────
@@ -383,10 +672,13 @@ def main() -> None:
             print(f"  vectors:   {stats['vector_count']}")
 
         elif args.action == "delete":
-            delete_namespace(cfg, namespace=args.ns, skip_confirm=args.yes)
+            if not delete_namespace(cfg, namespace=args.ns, skip_confirm=args.yes):
+                _aborted("Namespace not deleted")
+            _forget_upserts(cfg, args.ns or cfg.namespace)
 
         elif args.action == "copy":
             copied = copy_namespace(cfg, source_ns=args.source_ns, target_ns=args.target_ns)
+            _forget_upserts(cfg, args.target_ns)
             print(f"Copied {copied} vectors from '{args.source_ns}' to '{args.target_ns}'")
 
     # ── backup commands ────────────────────────────────────────────────────
@@ -399,13 +691,19 @@ def main() -> None:
 
         if args.action == "export":
             if args.metadata_only:
-                count = export_metadata_only(cfg, output_file=args.file)
+                count = export_metadata_only(
+                    cfg, output_file=args.file, format=args.format,
+                )
             else:
-                count = export_namespace(cfg, output_file=args.file)
+                count = export_namespace(
+                    cfg, output_file=args.file, precision=args.precision,
+                    format=args.format,
+                )
             print(f"Exported {count} vector(s) to {args.file}")
 
         elif args.action == "import":
             count = import_vectors(cfg, input_file=args.file, replace=args.replace)
+            _forget_upserts(cfg, cfg.namespace)
             print(f"Imported {count} vector(s) from {args.file}")
 
 
@@ -1,6 +1,13 @@
 """Pinecone client factory.
 
 Thin wrapper so every module doesn't create its own ``Pinecone()`` instance.
+Clients and Index handles are cached per API key / index name, so repeated
+calls reuse the same connection pool instead of re-initialising the SDK.
+
+With ``config.use_grpc`` the gRPC client (``pip install "pinecone[grpc]"``)
+is used instead of REST: vectors travel as packed protobuf floats rather
+than JSON text, which is smaller on the wire and cheaper to encode for
+bulk upserts.
 
 Usage
 -----
@@ -14,17 +21,51 @@ Usage
 
 from __future__ import annotations
 
-from pinecone import Pinecone
+import functools
+import sys
+from typing import TYPE_CHECKING
 
 from tools.pinecone.config import PineconeConfig
 
+if TYPE_CHECKING:
+    from pinecone import Pinecone
+
 
 def get_client(config: PineconeConfig) -> Pinecone:
     """Return an authenticated Pinecone client."""
-    return Pinecone(api_key=config.api_key)
+    return _client_cached(config.api_key, config.use_grpc)
 
 
 def get_index(config: PineconeConfig):
     """Return a ready-to-use Pinecone Index object."""
-    pc = get_client(config)
-    return pc.Index(config.index_name)
+    return _index_cached(config.api_key, config.index_name, config.use_grpc)
+
+
+def clear_cache() -> None:
+    """Drop cached clients and Index handles (e.g. after deleting an index)."""
+    _index_cached.cache_clear()
+    _client_cached.cache_clear()
+
+
+# Keyed on the hashable config fields — PineconeConfig itself is mutable.
+
+@functools.lru_cache(maxsize=8)
+def _client_cached(api_key: str, use_grpc: bool = False) -> Pinecone:
+    # The SDK is imported here, not at module level, so importing the
+    # toolkit (or a CLI --help) doesn't pay for loading it.
+    if not use_grpc:
+        try:
+            from pinecone import Pinecone
+        except ImportError:
+            sys.exit("ERROR: pip install pinecone")
+        return Pinecone(api_key=api_key)
+    try:
+        from pinecone.grpc import PineconeGRPC
+    except ImportError:
+        sys.exit('ERROR: pip install "pinecone[grpc]"')
+    return PineconeGRPC(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _index_cached(api_key: str, index_name: str, use_grpc: bool = False):
+    return _client_cached(api_key, use_grpc).Index(index_name)
@@ -10,6 +10,9 @@ Usage
     # From a JSON config file (recommended)
     cfg = PineconeConfig.from_json("config.json")
 
+    # From an already-parsed config dict
+    cfg = PineconeConfig.from_json_dict(data, source="config.json")
+
     # From environment variables (.env loaded automatically)
     cfg = PineconeConfig.from_env()
 
@@ -27,8 +30,13 @@ import os
 import sys
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # optional — faster parsing
+    orjson = None
+
 
-@dataclass
+@dataclass(slots=True)
 class PineconeConfig:
     """All settings needed to talk to a Pinecone index."""
 
@@ -37,6 +45,7 @@ class PineconeConfig:
     namespace: str = "default"
     cloud: str = "aws"
     region: str = "us-east-1"
+    use_grpc: bool = False
 
     # --- factories ---------------------------------------------------------
 
@@ -52,7 +61,8 @@ class PineconeConfig:
                 "index_name": "...",
                 "namespace": "chatbot",
                 "cloud": "aws",
-                "region": "us-east-1"
+                "region": "us-east-1",
+                "use_grpc": false
               }
             }
 
@@ -60,22 +70,32 @@ class PineconeConfig:
         are required; the rest have sensible defaults.
         """
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_file, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except FileNotFoundError:
             sys.exit(f"ERROR: Config file not found: {json_file}")
         except json.JSONDecodeError as exc:
             sys.exit(f"ERROR: Invalid JSON in {json_file}: {exc}")
 
+        return cls.from_json_dict(data, source=json_file)
+
+    @classmethod
+    def from_json_dict(cls, data: dict, source: str = "config") -> PineconeConfig:
+        """Build config from an already-parsed JSON config dict.
+
+        Takes the same structure as :meth:`from_json`.  *source* names the
+        origin of *data* in error messages.
+        """
         pc = data.get("pinecone", {})
 
         api_key = pc.get("api_key", "")
         index_name = pc.get("index_name", "")
 
         if not api_key:
-            sys.exit(f"ERROR: Missing 'pinecone.api_key' in {json_file}")
+            sys.exit(f"ERROR: Missing 'pinecone.api_key' in {source}")
         if not index_name:
-            sys.exit(f"ERROR: Missing 'pinecone.index_name' in {json_file}")
+            sys.exit(f"ERROR: Missing 'pinecone.index_name' in {source}")
 
         return cls(
             api_key=api_key,
@@ -83,6 +103,7 @@ class PineconeConfig:
             namespace=pc.get("namespace", "default"),
             cloud=pc.get("cloud", "aws"),
             region=pc.get("region", "us-east-1"),
+            use_grpc=bool(pc.get("use_grpc", False)),
         )
 
     @classmethod
@@ -100,6 +121,7 @@ class PineconeConfig:
             PINECONE_NAMESPACE   ("default")
             PINECONE_CLOUD       ("aws")
             PINECONE_REGION      ("us-east-1")
+            PINECONE_USE_GRPC    ("false")
         """
         if env_file:
             try:
@@ -125,4 +147,5 @@ class PineconeConfig:
             namespace=os.getenv("PINECONE_NAMESPACE", "default"),
             cloud=os.getenv("PINECONE_CLOUD", "aws"),
             region=os.getenv("PINECONE_REGION", "us-east-1"),
+            use_grpc=os.getenv("PINECONE_USE_GRPC", "").lower() in ("1", "true", "yes"),
         )
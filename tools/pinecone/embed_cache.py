@@ -0,0 +1,113 @@
+"""Content-addressed embedding cache — skip re-embedding unchanged text.
+
+Vectors are stored in the local SQLite cache database (see
+:mod:`tools.pinecone.sqlite_store`) keyed on a hash of ``(model, text)``, so re-running an ingest on a lightly edited document
+only sends the changed chunks to the embedding provider.
+
+Usage
+-----
+    from tools.pinecone.embed_cache import EmbedCache
+
+    cache = EmbedCache()                      # ~/.cache/chatbotai/cache.db
+    vectors = cache.get_or_compute_many(
+        texts, model="text-embedding-3-small", compute=my_batch_embed_fn,
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from array import array
+from pathlib import Path
+from typing import Callable
+
+from tools.pinecone.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(text: str, model: str) -> str:
+    """Return the cache key for *text* embedded with *model*."""
+    return hashlib.blake2b(
+        f"{model}\0{text}".encode("utf-8"), digest_size=16,
+    ).hexdigest()
+
+
+class EmbedCache(SQLiteStore):
+    """SQLite-backed ``(model, text) -> vector`` cache.
+
+    Vectors are stored as packed float32 blobs.  The cache is safe to share
+    between threads.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """
+        Args:
+            path: Database file.  Defaults to ``~/.cache/chatbotai/cache.db``.
+        """
+        super().__init__(
+            path, "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB)",
+        )
+
+    # ── lookup / store ─────────────────────────────────────────────────────
+
+    def get(self, text: str, model: str) -> list[float] | None:
+        """Return the cached vector for *text*, or ``None`` on a miss."""
+        return self.get_many([text], model)[0]
+
+    def put(self, text: str, model: str, vector: list[float]) -> None:
+        """Store *vector* for *text*."""
+        self.put_many([text], model, [vector])
+
+    def get_many(self, texts: list[str], model: str) -> list[list[float] | None]:
+        """Return cached vectors for *texts* (``None`` for each miss)."""
+        keys = [cache_key(t, model) for t in texts]
+        found = self._select_in("SELECT key, vec FROM embeddings WHERE key IN ({})", keys)
+        return [array("f", found[k]).tolist() if k in found else None for k in keys]
+
+    def put_many(
+        self,
+        texts: list[str],
+        model: str,
+        vectors: list[list[float]],
+    ) -> None:
+        """Store *vectors* for *texts*."""
+        rows = [
+            (cache_key(t, model), array("f", v).tobytes())
+            for t, v in zip(texts, vectors)
+        ]
+        self._execute_many("INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)", rows)
+
+    def get_or_compute_many(
+        self,
+        texts: list[str],
+        model: str,
+        compute: Callable[[list[str]], list[list[float]]],
+    ) -> list[list[float]]:
+        """Return vectors for *texts*, computing and caching only the misses.
+
+        Args:
+            texts:   Texts to embed.
+            model:   Embedding model name (part of the cache key).
+            compute: Batch embedding function called once with all misses.
+
+        Returns:
+            One vector per input text, in input order.
+        """
+        vectors = self.get_many(texts, model)
+        misses = [i for i, v in enumerate(vectors) if v is None]
+
+        logger.info(
+            "Embedding cache: %d hit(s), %d miss(es)",
+            len(texts) - len(misses), len(misses),
+        )
+
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            computed = compute(miss_texts)
+            self.put_many(miss_texts, model, computed)
+            for i, vec in zip(misses, computed):
+                vectors[i] = vec
+
+        return vectors
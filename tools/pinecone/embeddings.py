@@ -1,8 +1,9 @@
 """Standalone embedding functions — decouple embedding from any specific vector store.
 
 Provides a unified interface for generating embeddings from different
-providers (OpenAI, Cohere, or custom).  Each function returns a standard
-``list[float]`` vector or a list of vectors for batch calls.
+providers — the OpenAI API, or a local ``sentence-transformers`` model
+(``provider="local"``).  Each function returns a standard ``list[float]``
+vector or a list of vectors for batch calls.
 
 Usage
 -----
@@ -11,23 +12,48 @@ Usage
     # Single text
     vector = embed_text("hello world", api_key="sk-...", model="text-embedding-3-small")
 
-    # Batch (more efficient — fewer API calls)
+    # Batch (more efficient — fewer API calls, sent concurrently)
     vectors = embed_batch(["hello", "world"], api_key="sk-...", model="text-embedding-3-small")
 
     # Create a reusable function
     embed = make_embed_fn(api_key="sk-...", model="text-embedding-3-small")
     vec = embed("hello world")
+
+    # Or a reusable batch function (list[str] -> list[list[float]])
+    embed_many = make_batch_embed_fn(api_key="sk-...", model="small")
+    vecs = embed_many(["hello", "world"])
+
+    # Bulk offline ingestion — OpenAI Batch API, half price, up to 24 h turnaround
+    vectors = embed_batch_api(texts, api_key="sk-...", model="small")
+
+    # Skip re-embedding unchanged text across runs
+    from tools.pinecone.embed_cache import EmbedCache
+    embed_many = make_batch_embed_fn(model="small", cache=EmbedCache())
+
+    # Local model on CPU — no API calls (pip install sentence-transformers)
+    embed = make_embed_fn(model="bge-small", provider="local")
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
 import sys
-from typing import Callable
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from tools.pinecone.utils import chunks
+
+if TYPE_CHECKING:
+    from tools.pinecone.embed_cache import EmbedCache
 
 logger = logging.getLogger(__name__)
 
 EmbedFn = Callable[[str], list[float]]
+BatchEmbedFn = Callable[[list[str]], list[list[float]]]
 
 # ── model catalogue ──────────────────────────────────────────────────────────
 
@@ -42,6 +68,32 @@ OPENAI_MODELS = {
     },
 }
 
+# sentence-transformers models for ``provider="local"`` (any other model
+# name on the Hugging Face hub works too).
+LOCAL_MODELS = {
+    "bge-small": {
+        "name": "BAAI/bge-small-en-v1.5",
+        "dimensions": 384,
+    },
+    "minilm": {
+        "name": "sentence-transformers/all-MiniLM-L6-v2",
+        "dimensions": 384,
+    },
+}
+
+PROVIDERS = ("openai", "local")
+
+# Aliases and full names → dimensions, for O(1) lookups.
+_DIM_BY_NAME = {
+    key: info["dimensions"]
+    for models in (OPENAI_MODELS, LOCAL_MODELS)
+    for alias, info in models.items()
+    for key in (alias, info["name"])
+}
+
+# Texts per forward pass of a local model.
+_LOCAL_BATCH_SIZE = 64
+
 
 def get_model_dimensions(model: str) -> int:
     """Return the output dimension for a known embedding model.
@@ -50,19 +102,14 @@ def get_model_dimensions(model: str) -> int:
     ----------
     model : str
         Full model name (e.g. ``"text-embedding-3-small"``) or short alias
-        (``"small"``, ``"large"``).
+        (``"small"``, ``"large"``, ``"bge-small"``, ``"minilm"``).
 
     Returns
     -------
     int
         Embedding dimension, or 0 if unknown.
     """
-    if model in OPENAI_MODELS:
-        return OPENAI_MODELS[model]["dimensions"]
-    for info in OPENAI_MODELS.values():
-        if info["name"] == model:
-            return info["dimensions"]
-    return 0
+    return _DIM_BY_NAME.get(model, 0)
 
 
 def resolve_model_name(model: str) -> str:
@@ -70,13 +117,104 @@ def resolve_model_name(model: str) -> str:
 
     ``"small"`` → ``"text-embedding-3-small"``
     ``"large"`` → ``"text-embedding-3-large"``
+    ``"bge-small"`` → ``"BAAI/bge-small-en-v1.5"``
     Anything else passes through unchanged.
     """
-    if model in OPENAI_MODELS:
-        return OPENAI_MODELS[model]["name"]
+    for models in (OPENAI_MODELS, LOCAL_MODELS):
+        if model in models:
+            return models[model]["name"]
     return model
 
 
+def _check_provider(provider: str, model: str) -> None:
+    """Exit on an unknown provider, or an OpenAI model asked of the local one."""
+    if provider not in PROVIDERS:
+        sys.exit(f"ERROR: Unsupported embedding provider: {provider}")
+    if provider == "local" and model.startswith("text-embedding-"):
+        sys.exit(
+            f"ERROR: '{model}' is an OpenAI model — pass a sentence-transformers "
+            f"model for provider 'local' (e.g. model='bge-small')"
+        )
+
+
+def _numpy():
+    """Import numpy on demand — only needed for ``as_array=True``."""
+    try:
+        import numpy
+    except ImportError:
+        sys.exit("ERROR: pip install numpy")
+    return numpy
+
+
+# ── client ───────────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: str | None):
+    """Return a shared sync OpenAI client, so its HTTP connection pool is reused."""
+    try:
+        import openai
+    except ImportError:
+        sys.exit("ERROR: pip install openai")
+
+    return openai.OpenAI(api_key=api_key) if api_key else openai.OpenAI()
+
+
+@functools.lru_cache(maxsize=4)
+def _async_openai_client(api_key: str | None):
+    """Return a shared async OpenAI client — only ever used on :func:`_event_loop`."""
+    try:
+        import openai
+    except ImportError:
+        sys.exit("ERROR: pip install openai")
+
+    return openai.AsyncOpenAI(api_key=api_key) if api_key else openai.AsyncOpenAI()
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop that runs all async embedding calls.
+
+    One long-lived loop on a daemon thread, so :func:`embed_batch` works
+    whether or not the caller is already inside a running loop (Jupyter,
+    async web handlers), and the cached async client always stays on the
+    loop its connection pool was created on.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="embeddings-loop", daemon=True,
+            ).start()
+    return _loop
+
+
+@functools.lru_cache(maxsize=2)
+def _local_model(name: str):
+    """Load a sentence-transformers model once per process."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        sys.exit("ERROR: pip install sentence-transformers")
+
+    logger.info("Loading local embedding model %s ...", name)
+    return SentenceTransformer(name)
+
+
+def _embed_local(texts: list[str], model: str, as_array: bool = False):
+    """Embed *texts* with a local model (unit-length float32 vectors)."""
+    vectors = _local_model(model).encode(
+        texts,
+        batch_size=_LOCAL_BATCH_SIZE,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+    ).astype("float32", copy=False)
+    return vectors if as_array else vectors.tolist()
+
+
 # ── single text ──────────────────────────────────────────────────────────────
 
 def embed_text(
@@ -95,9 +233,10 @@ def embed_text(
         API key for the provider.  Falls back to the standard env var
         (``OPENAI_API_KEY`` for OpenAI).
     model : str
-        Model name or alias (``"small"`` / ``"large"``).
+        Model name or alias (``"small"`` / ``"large"``, or e.g.
+        ``"bge-small"`` with ``provider="local"``).
     provider : str
-        Embedding provider (currently ``"openai"``).
+        Embedding provider: ``"openai"`` or ``"local"``.
 
     Returns
     -------
@@ -117,11 +256,14 @@ def embed_batch(
     model: str = "text-embedding-3-small",
     provider: str = "openai",
     batch_size: int = 100,
+    max_concurrency: int = 8,
+    as_array: bool = False,
 ) -> list[list[float]]:
     """Embed multiple texts in batches.
 
     More efficient than calling ``embed_text`` in a loop because it
-    batches API calls.
+    batches API calls, and keeps up to *max_concurrency* batches in
+    flight at once.  Repeated texts are only sent once.
 
     Parameters
     ----------
@@ -132,9 +274,15 @@ def embed_batch(
     model : str
         Model name or alias.
     provider : str
-        Embedding provider.
+        Embedding provider: ``"openai"`` or ``"local"``.
     batch_size : int
         Number of texts per API call (default 100).
+    max_concurrency : int
+        Maximum concurrent API calls (default 8).
+    as_array : bool
+        Return a 2-D ``numpy.float32`` array (one row per text) instead of
+        lists — about 8× less memory for large batches.  Requires numpy.
+        :meth:`VectorStore.upsert_vectors` accepts the rows directly.
 
     Returns
     -------
@@ -143,27 +291,179 @@ def embed_batch(
     """
     model = resolve_model_name(model)
 
-    if provider != "openai":
-        sys.exit(f"ERROR: Unsupported embedding provider: {provider}")
+    _check_provider(provider, model)
 
-    try:
-        import openai
-    except ImportError:
-        sys.exit("ERROR: pip install openai")
+    np = _numpy() if as_array else None
 
-    client = openai.OpenAI(api_key=api_key) if api_key else openai.OpenAI()
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32) if as_array else []
 
-    all_embeddings: list[list[float]] = []
+    # Embed each distinct text once and fan the vectors back out.
+    unique = list(dict.fromkeys(texts))
+    if provider == "local":
+        vectors = _embed_local(unique, model, as_array)
+    else:
+        vectors = asyncio.run_coroutine_threadsafe(
+            _embed_all(unique, api_key, model, batch_size, max_concurrency, as_array),
+            _event_loop(),
+        ).result()
+    if len(unique) == len(texts):
+        return vectors
 
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i : i + batch_size]
-        response = client.embeddings.create(input=batch, model=model)
-        # Sort by index to preserve order
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        all_embeddings.extend([d.embedding for d in sorted_data])
-        logger.info("Embedded batch %d–%d of %d", i + 1, i + len(batch), len(texts))
+    logger.info("Skipped %d duplicate text(s)", len(texts) - len(unique))
+    if as_array:
+        row = {t: k for k, t in enumerate(unique)}
+        return vectors[[row[t] for t in texts]]
+    by_text = dict(zip(unique, vectors))
+    return [by_text[t] for t in texts]
+
+
+async def _embed_all(
+    texts: list[str],
+    api_key: str | None,
+    model: str,
+    batch_size: int,
+    max_concurrency: int,
+    as_array: bool = False,
+):
+    """Embed *texts* with concurrent batched requests on the shared async client.
+
+    Texts are grouped by length so each request carries similar-sized
+    inputs (no single long text holding up a batch of short ones); the
+    vectors are scattered back to input order.  With *as_array*, rows are
+    written straight into one preallocated float32 array.
+    """
+    client = _async_openai_client(api_key)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = None if as_array else [None] * len(texts)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    done = 0
+
+    async def embed_one(indices: list[int]) -> None:
+        nonlocal done, results
+        async with semaphore:
+            response = await client.embeddings.create(
+                input=[texts[i] for i in indices], model=model,
+            )
+        # The API returns embeddings in request order.
+        data = response.data
+        if logger.isEnabledFor(logging.DEBUG):
+            assert [d.index for d in data] == list(range(len(indices))), \
+                "embeddings returned out of request order"
+        if as_array:
+            if results is None:
+                np = _numpy()
+                dim = len(data[0].embedding)
+                results = np.empty((len(texts), dim), dtype=np.float32)
+            results[indices] = [d.embedding for d in data]
+        else:
+            for i, d in zip(indices, data):
+                results[i] = d.embedding
+        done += len(indices)
+        logger.debug("Embedded %d of %d", done, len(texts))
+
+    await asyncio.gather(*(embed_one(batch) for batch in chunks(order, batch_size)))
+
+    logger.info("Embedded %d text(s)", len(texts))
+    return results
+
+
+# ── Batch API ────────────────────────────────────────────────────────────────
+
+# Terminal states of an OpenAI batch job.
+_BATCH_DONE = ("completed", "failed", "expired", "cancelled")
+
+
+def embed_batch_api(
+    texts: list[str],
+    api_key: str | None = None,
+    model: str = "text-embedding-3-small",
+    batch_size: int = 100,
+    poll_interval: float = 30.0,
+) -> list[list[float]]:
+    """Embed texts through the OpenAI Batch API.
 
-    return all_embeddings
+    Same vectors as :func:`embed_batch` at half the price and on a
+    separate rate-limit pool, but the job may take up to 24 hours — meant
+    for large offline ingestions.  Blocks until the job finishes.
+
+    Parameters
+    ----------
+    texts : list[str]
+        Texts to embed.
+    api_key : str | None
+        OpenAI API key.
+    model : str
+        Model name or alias.
+    batch_size : int
+        Texts per request line in the batch file.
+    poll_interval : float
+        Seconds between job status checks.
+
+    Returns
+    -------
+    list[list[float]]
+        List of embedding vectors (same order as input).
+    """
+    model = resolve_model_name(model)
+
+    if not texts:
+        return []
+
+    client = _openai_client(api_key)
+
+    # One request line per batch; custom_id is the batch's offset in *texts*.
+    lines = []
+    for i in range(0, len(texts), batch_size):
+        lines.append(json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/embeddings",
+            "body": {"model": model, "input": texts[i : i + batch_size]},
+        }))
+    upload = client.files.create(
+        file=("embeddings.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h",
+    )
+    logger.info("Submitted batch %s (%d text(s), %d request(s))", batch.id, len(texts), len(lines))
+
+    while batch.status not in _BATCH_DONE:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        logger.info(
+            "Batch %s: %s (%s/%s requests done)",
+            batch.id, batch.status,
+            getattr(counts, "completed", "?"), getattr(counts, "total", "?"),
+        )
+
+    if batch.status != "completed" or not batch.output_file_id:
+        sys.exit(f"ERROR: Embedding batch {batch.id} ended with status '{batch.status}'")
+
+    results: list[list[float] | None] = [None] * len(texts)
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            sys.exit(
+                f"ERROR: Embedding request {record.get('custom_id')} failed: "
+                f"{record.get('error') or response.get('body')}"
+            )
+        offset = int(record["custom_id"])
+        for d in response["body"]["data"]:
+            results[offset + d["index"]] = d["embedding"]
+
+    missing = sum(v is None for v in results)
+    if missing:
+        sys.exit(f"ERROR: Embedding batch {batch.id} returned no vector for {missing} text(s)")
+    return results
 
 
 # ── factory ──────────────────────────────────────────────────────────────────
@@ -172,6 +472,7 @@ def make_embed_fn(
     api_key: str | None = None,
     model: str = "text-embedding-3-small",
     provider: str = "openai",
+    cache: EmbedCache | None = None,
 ) -> EmbedFn:
     """Create a reusable embedding function.
 
@@ -182,7 +483,10 @@ def make_embed_fn(
     model : str
         Model name or alias.
     provider : str
-        Embedding provider (currently ``"openai"``).
+        Embedding provider: ``"openai"`` or ``"local"``.
+    cache : EmbedCache | None
+        Optional embedding cache — texts already in it are not sent to
+        the provider.
 
     Returns
     -------
@@ -191,18 +495,84 @@ def make_embed_fn(
     """
     model = resolve_model_name(model)
 
-    if provider != "openai":
-        sys.exit(f"ERROR: Unsupported embedding provider: {provider}")
+    _check_provider(provider, model)
 
-    try:
-        import openai
-    except ImportError:
-        sys.exit("ERROR: pip install openai")
+    if provider == "local":
+        def embed(text: str) -> list[float]:
+            return _embed_local([text], model)[0]
+    else:
+        client = _openai_client(api_key)
+
+        def embed(text: str) -> list[float]:
+            response = client.embeddings.create(input=text, model=model)
+            return response.data[0].embedding
+
+    if cache is None:
+        return embed
+
+    def embed_cached(text: str) -> list[float]:
+        vector = cache.get(text, model)
+        if vector is None:
+            vector = embed(text)
+            cache.put(text, model, vector)
+        return vector
+
+    return embed_cached
+
+
+def make_batch_embed_fn(
+    api_key: str | None = None,
+    model: str = "text-embedding-3-small",
+    provider: str = "openai",
+    batch_size: int = 100,
+    max_concurrency: int = 8,
+    cache: EmbedCache | None = None,
+) -> BatchEmbedFn:
+    """Create a reusable batch embedding function.
+
+    The returned callable embeds a whole list of texts with
+    :func:`embed_batch` — one API call per *batch_size* texts instead of
+    one per text.
+
+    Parameters
+    ----------
+    api_key : str | None
+        Provider API key.
+    model : str
+        Model name or alias.
+    provider : str
+        Embedding provider: ``"openai"`` or ``"local"``.
+    batch_size : int
+        Number of texts per API call.
+    max_concurrency : int
+        Maximum concurrent API calls.
+    cache : EmbedCache | None
+        Optional embedding cache — only texts missing from it are sent to
+        the provider, in one batched call.
+
+    Returns
+    -------
+    BatchEmbedFn
+        A callable ``(list[str]) -> list[list[float]]``.
+    """
+    model = resolve_model_name(model)
+
+    _check_provider(provider, model)
+
+    def embed_many(texts: list[str]) -> list[list[float]]:
+        return embed_batch(
+            texts,
+            api_key=api_key,
+            model=model,
+            provider=provider,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
 
-    client = openai.OpenAI(api_key=api_key) if api_key else openai.OpenAI()
+    if cache is None:
+        return embed_many
 
-    def embed(text: str) -> list[float]:
-        response = client.embeddings.create(input=text, model=model)
-        return response.data[0].embedding
+    def embed_many_cached(texts: list[str]) -> list[list[float]]:
+        return cache.get_or_compute_many(texts, model, embed_many)
 
-    return embed
+    return embed_many_cached
@@ -5,10 +5,11 @@ without performing a similarity search.
 
 Usage
 -----
-    from tools.pinecone.fetch import fetch_vectors, fetch_one
+    from tools.pinecone.fetch import fetch_vectors, fetch_one, vectors_exist
 
     results = fetch_vectors(config, ids=["doc-1", "doc-2"])
     single  = fetch_one(config, id="doc-1")
+    exists  = vectors_exist(config, ids=["doc-1", "doc-2"])   # {"doc-1": True, ...}
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from typing import TYPE_CHECKING
 
 from tools.pinecone.config import PineconeConfig
 from tools.pinecone.client import get_index
+from tools.pinecone.utils import chunks, run_concurrently
 
 if TYPE_CHECKING:
     pass
@@ -29,9 +31,14 @@ def fetch_vectors(
     config: PineconeConfig,
     ids: list[str],
     namespace: str | None = None,
+    batch_size: int = 100,
+    max_workers: int = 8,
 ) -> list[dict]:
     """Fetch vectors by their IDs.
 
+    Large ID lists are split into *batch_size* requests, up to
+    *max_workers* of which run concurrently.
+
     Parameters
     ----------
     config : PineconeConfig
@@ -40,6 +47,10 @@ def fetch_vectors(
         Vector IDs to fetch.
     namespace : str | None
         Namespace to fetch from (defaults to config.namespace).
+    batch_size : int
+        IDs per fetch request (Pinecone allows up to 1000).
+    max_workers : int
+        Concurrent fetch requests.
 
     Returns
     -------
@@ -50,8 +61,7 @@ def fetch_vectors(
     index = get_index(config)
     ns = namespace or config.namespace
 
-    response = index.fetch(ids=ids, namespace=ns)
-    vectors = response.get("vectors", {})
+    vectors = _fetch_raw(index, ids, ns, batch_size, max_workers)
 
     results = []
     for vec_id, vec_data in vectors.items():
@@ -114,4 +124,60 @@ def vector_exists(
     bool
         ``True`` if the vector exists, ``False`` otherwise.
     """
-    return fetch_one(config, id=id, namespace=namespace) is not None
+    ns = namespace or config.namespace
+    response = get_index(config).fetch(ids=[id], namespace=ns)
+    return bool(response.get("vectors"))
+
+
+def vectors_exist(
+    config: PineconeConfig,
+    ids: list[str],
+    namespace: str | None = None,
+    batch_size: int = 100,
+    max_workers: int = 8,
+) -> dict[str, bool]:
+    """Check which of *ids* exist in the index.
+
+    Uses the same batched, concurrent fetch as :func:`fetch_vectors`, so
+    checking many IDs costs one request per *batch_size* IDs.
+
+    Parameters
+    ----------
+    config : PineconeConfig
+        Pinecone connection settings.
+    ids : list[str]
+        Vector IDs to check.
+    namespace : str | None
+        Namespace to check in.
+    batch_size : int
+        IDs per fetch request.
+    max_workers : int
+        Concurrent fetch requests.
+
+    Returns
+    -------
+    dict[str, bool]
+        Maps each ID to whether it exists.
+    """
+    ns = namespace or config.namespace
+    found = _fetch_raw(get_index(config), ids, ns, batch_size, max_workers)
+    return {vec_id: vec_id in found for vec_id in ids}
+
+
+# ── internal helpers ────────────────────────────────────────────────────────
+
+def _fetch_raw(
+    index,
+    ids: list[str],
+    namespace: str,
+    batch_size: int,
+    max_workers: int,
+) -> dict:
+    """Fetch *ids* in concurrent batches; return the merged ``vectors`` mapping."""
+    def fetch(batch: list[str]) -> dict:
+        return index.fetch(ids=batch, namespace=namespace).get("vectors", {})
+
+    vectors: dict = {}
+    for batch_vectors in run_concurrently(fetch, chunks(ids, batch_size), max_workers):
+        vectors.update(batch_vectors)
+    return vectors
@@ -19,13 +19,17 @@ import argparse
 import logging
 import time
 
-from pinecone import Pinecone, ServerlessSpec
-
 from tools.pinecone.config import PineconeConfig
-from tools.pinecone.client import get_client
+from tools.pinecone.client import clear_cache, get_client
+from tools.pinecone.utils import confirm
 
 logger = logging.getLogger(__name__)
 
+# Readiness polling after create: first delay, growth factor, cap (seconds).
+_POLL_INITIAL = 0.5
+_POLL_BACKOFF = 1.6
+_POLL_MAX = 5.0
+
 
 # ── Create ─────────────────────────────────────────────────────────────────
 
@@ -44,10 +48,9 @@ def create_index(
     pc = get_client(config)
     name = config.index_name
 
-    existing = [idx.name for idx in pc.list_indexes()]
-    if name in existing:
+    desc = _describe_or_none(pc, name)
+    if desc is not None:
         logger.info("Index '%s' already exists — skipping creation.", name)
-        desc = pc.describe_index(name)
         logger.info("  dimension=%s  metric=%s  status=%s",
                      desc.dimension, desc.metric, desc.status)
         return
@@ -57,6 +60,8 @@ def create_index(
         name, dimension, metric, config.cloud, config.region,
     )
 
+    from pinecone import ServerlessSpec  # lazy — only needed to create
+
     pc.create_index(
         name=name,
         dimension=dimension,
@@ -64,13 +69,15 @@ def create_index(
         spec=ServerlessSpec(cloud=config.cloud, region=config.region),
     )
 
-    # Wait until ready
+    # Wait until ready — poll quickly at first, then back off
     logger.info("Waiting for index to be ready …")
+    delay = _POLL_INITIAL
     while True:
         desc = pc.describe_index(name)
         if desc.status.get("ready"):
             break
-        time.sleep(2)
+        time.sleep(delay)
+        delay = min(delay * _POLL_BACKOFF, _POLL_MAX)
 
     logger.info("Index '%s' is ready!", name)
     logger.info("  host:      %s", desc.host)
@@ -83,41 +90,54 @@ def create_index(
 def delete_index(
     config: PineconeConfig,
     skip_confirm: bool = False,
-) -> None:
+) -> bool:
     """Delete a Pinecone index.
 
     Args:
         config:       PineconeConfig with api_key and index_name.
         skip_confirm: If True, skip the interactive confirmation prompt.
+
+    Returns:
+        ``False`` if the confirmation was declined, ``True`` otherwise.
     """
     pc = get_client(config)
     name = config.index_name
 
-    existing = [idx.name for idx in pc.list_indexes()]
-    if name not in existing:
+    desc = _describe_or_none(pc, name)
+    if desc is None:
+        existing = [idx.name for idx in pc.list_indexes()]
         logger.error("Index '%s' does not exist.", name)
         logger.info("Available indexes: %s", existing or "(none)")
-        return
+        return True
 
-    desc = pc.describe_index(name)
     logger.info("Found index '%s':", name)
     logger.info("  host:      %s", desc.host)
     logger.info("  dimension: %s", desc.dimension)
     logger.info("  metric:    %s", desc.metric)
     logger.info("  status:    %s", desc.status)
 
-    if not skip_confirm:
-        answer = input(
-            f"\nAre you sure you want to delete '{name}'? "
-            f"This action is irreversible. [y/N] "
-        )
-        if answer.strip().lower() not in ("y", "yes"):
-            logger.info("Aborted.")
-            return
+    if not skip_confirm and not confirm(
+        f"\nAre you sure you want to delete '{name}'? "
+        f"This action is irreversible. [y/N] "
+    ):
+        logger.info("Aborted.")
+        return False
 
     logger.info("Deleting index '%s' …", name)
     pc.delete_index(name)
+    clear_cache()
     logger.info("Index '%s' has been deleted.", name)
+    return True
+
+
+def _describe_or_none(pc, name: str):
+    """Return ``pc.describe_index(name)``, or ``None`` if there is no such index."""
+    from pinecone.exceptions import NotFoundException  # lazy, like ServerlessSpec
+
+    try:
+        return pc.describe_index(name)
+    except NotFoundException:
+        return None
 
 
 # ── List ───────────────────────────────────────────────────────────────────
@@ -0,0 +1,214 @@
+"""JSON helpers with optional fast backends.
+
+Uses ``orjson`` for parsing/serialising and ``ijson`` to stream array
+items when they are installed; falls back to the stdlib ``json`` module
+otherwise.  Without ``ijson``, array files are streamed item by item
+with the stdlib decoder, so memory stays flat however large the file;
+only small files (under ``_MAX_WHOLE_FILE`` bytes) are instead parsed in
+one go by ``orjson``.  NDJSON lines are always parsed one at a time.
+Both backends raise :class:`JSONDecodeError` on bad input.
+
+Usage
+-----
+    from tools.pinecone.jsonio import dumps, iter_json_array, loads
+
+    data = loads(path.read_bytes())
+    sys.stdout.buffer.write(dumps(data, indent=True))
+
+    for item in iter_json_array("backup.json"):
+        ...
+
+    for record in iter_json_records("backup.ndjson"):   # array or NDJSON
+        ...
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+try:
+    import ijson
+except ImportError:  # optional — stream parsing only
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional — faster parse/dump
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both.
+JSONDecodeError = json.JSONDecodeError
+
+_WHITESPACE = b" \t\r\n"
+_READ_SIZE = 1 << 16
+
+# Array files up to this size are parsed whole by orjson when ijson is
+# missing — faster than streaming, and the parsed tree stays small.
+_MAX_WHOLE_FILE = 16 << 20
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 JSON bytes (non-JSON types via ``str``)."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=str,
+    ).encode("utf-8")
+
+
+def iter_json_array(path: str | Path) -> Iterator[dict]:
+    """Iterate over the items of a top-level JSON array file.
+
+    The file is checked eagerly, so a non-array file raises before the
+    caller starts consuming items.
+
+    Raises
+    ------
+    ValueError
+        If the file does not contain a top-level JSON array.
+    """
+    f = open(path, "rb")
+    try:
+        first = _first_byte(f)
+        if first != b"[":
+            kind = "an empty file" if not first else f"'{first.decode(errors='replace')}'"
+            raise ValueError(f"Expected a JSON array in {path}, found {kind}")
+    except BaseException:
+        f.close()
+        raise
+    return _iter_items(f)
+
+
+def iter_json_records(path: str | Path) -> Iterator[dict]:
+    """Iterate over the records of a JSON array or NDJSON file.
+
+    The format is detected from the first non-whitespace byte: ``[`` is
+    read as a JSON array, ``{`` as one JSON object per line.
+
+    Raises
+    ------
+    ValueError
+        If the file is neither a JSON array nor NDJSON.
+    """
+    f = open(path, "rb")
+    try:
+        first = _first_byte(f)
+        if first not in (b"[", b"{"):
+            kind = "an empty file" if not first else f"'{first.decode(errors='replace')}'"
+            raise ValueError(f"Expected a JSON array or NDJSON in {path}, found {kind}")
+    except BaseException:
+        f.close()
+        raise
+    return _iter_items(f) if first == b"[" else _iter_lines(f)
+
+
+def _iter_lines(f: BinaryIO) -> Iterator[dict]:
+    with f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def _iter_items(f: BinaryIO) -> Iterator[dict]:
+    with f:
+        if ijson is not None:
+            yield from ijson.items(f, "item", use_float=True)
+        elif orjson is not None and os.fstat(f.fileno()).st_size <= _MAX_WHOLE_FILE:
+            yield from _load_mapped(f)
+        else:
+            yield from _iter_array_stdlib(f)
+
+
+def _load_mapped(f: BinaryIO):
+    """Parse the whole of *f* with ``orjson``.
+
+    The file is memory-mapped and parsed in place, so the raw bytes are
+    never copied into a Python object alongside the parsed tree.
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _iter_array_stdlib(f: BinaryIO) -> Iterator:
+    """Stream the items of a top-level JSON array with the stdlib decoder.
+
+    The file is read in blocks and each item is decoded with
+    ``JSONDecoder.raw_decode`` as soon as it is complete, so only one
+    block plus one item is held in memory at a time.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf, pos, eof = "", 0, False
+
+    def more() -> None:
+        nonlocal buf, pos, eof
+        block = f.read(_READ_SIZE)
+        eof = not block
+        buf = buf[pos:] + utf8.decode(block, final=eof)
+        pos = 0
+
+    def skip_ws() -> str:
+        """Advance past whitespace; return the next character ('' at EOF)."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos : pos + 1]
+            more()
+
+    skip_ws()
+    pos += 1  # the opening "[" (checked by the caller)
+    if skip_ws() == "]":
+        return
+
+    while True:
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except JSONDecodeError:
+            if eof:
+                raise
+            more()
+            continue
+        # A value ending exactly at the buffer edge may be truncated
+        # (e.g. a number) — re-read with more data before accepting it.
+        if end == len(buf) and not eof:
+            more()
+            continue
+        pos = end
+        yield item
+
+        sep = skip_ws()
+        if sep == "]":
+            return
+        if sep != ",":
+            raise JSONDecodeError("Expected ',' or ']'", buf, pos)
+        pos += 1
+        skip_ws()
+
+
+def _first_byte(f: BinaryIO) -> bytes:
+    """Return the first non-whitespace byte of *f* and rewind it."""
+    while block := f.read(4096):
+        stripped = block.lstrip(_WHITESPACE)
+        if stripped:
+            f.seek(0)
+            return stripped[:1]
+    f.seek(0)
+    return b""
@@ -14,12 +14,35 @@ Usage
 from __future__ import annotations
 
 import logging
+import time
+from itertools import chain
+from typing import Iterator
 
 from tools.pinecone.config import PineconeConfig
 from tools.pinecone.client import get_index
+from tools.pinecone.utils import (
+    MAX_BATCH_VECTORS,
+    UPSERT_RATE_LIMIT,
+    as_upsert_tuples,
+    chunks,
+    confirm,
+    retry_call,
+    run_concurrently,
+    send_upsert,
+    upsert_limiter,
+    vector_batches,
+)
 
 logger = logging.getLogger(__name__)
 
+# describe_index_stats() results, reused for a few seconds so back-to-back
+# calls (e.g. a stats check before a delete) cost one round-trip.
+_STATS_TTL = 2.0
+_stats_cache: dict[str, tuple[float, dict]] = {}
+
+# Most IDs ``index.list()`` returns per page.
+_LIST_LIMIT = 100
+
 
 def list_namespaces(config: PineconeConfig) -> dict[str, int]:
     """List all namespaces and their vector counts.
@@ -34,17 +57,13 @@ def list_namespaces(config: PineconeConfig) -> dict[str, int]:
     dict[str, int]
         Mapping of namespace name to vector count.
     """
-    index = get_index(config)
-    stats = index.describe_index_stats()
-    namespaces = {}
-    for ns, ns_stats in stats.get("namespaces", {}).items():
-        namespaces[ns] = ns_stats.get("vector_count", 0)
-    return namespaces
+    return _namespace_counts(_cached_stats(get_index(config), config.index_name))
 
 
 def get_namespace_stats(
     config: PineconeConfig,
     namespace: str | None = None,
+    namespaces: dict[str, int] | None = None,
 ) -> dict:
     """Get detailed stats for a specific namespace.
 
@@ -54,6 +73,9 @@ def get_namespace_stats(
         Pinecone connection settings.
     namespace : str | None
         Namespace to inspect (defaults to config.namespace).
+    namespaces : dict[str, int] | None
+        Output of :func:`list_namespaces` the caller already holds;
+        fetched when omitted.
 
     Returns
     -------
@@ -61,7 +83,7 @@ def get_namespace_stats(
         ``{"namespace", "vector_count", "exists"}``
     """
     ns = namespace or config.namespace
-    all_ns = list_namespaces(config)
+    all_ns = namespaces if namespaces is not None else list_namespaces(config)
 
     if ns in all_ns:
         return {
@@ -80,7 +102,7 @@ def delete_namespace(
     config: PineconeConfig,
     namespace: str | None = None,
     skip_confirm: bool = False,
-) -> None:
+) -> bool:
     """Delete all vectors in a namespace.
 
     Parameters
@@ -91,42 +113,54 @@ def delete_namespace(
         Namespace to delete (defaults to config.namespace).
     skip_confirm : bool
         Skip interactive confirmation.
+
+    Returns
+    -------
+    bool
+        ``False`` if the confirmation was declined, ``True`` otherwise.
     """
     index = get_index(config)
     ns = namespace or config.namespace
 
-    stats = get_namespace_stats(config, ns)
+    namespaces = _namespace_counts(_cached_stats(index, config.index_name))
+    stats = get_namespace_stats(config, ns, namespaces=namespaces)
     if not stats["exists"]:
         logger.warning("Namespace '%s' does not exist or is empty.", ns)
-        return
+        return True
 
     logger.info(
         "Namespace '%s' contains %d vector(s).",
         ns, stats["vector_count"],
     )
 
-    if not skip_confirm:
-        answer = input(
-            f"\nDelete ALL vectors in namespace '{ns}'? "
-            f"This is irreversible. [y/N] "
-        )
-        if answer.strip().lower() not in ("y", "yes"):
-            logger.info("Aborted.")
-            return
+    if not skip_confirm and not confirm(
+        f"\nDelete ALL vectors in namespace '{ns}'? "
+        f"This is irreversible. [y/N] "
+    ):
+        logger.info("Aborted.")
+        return False
 
     index.delete(delete_all=True, namespace=ns)
+    clear_stats_cache(config.index_name)
     logger.info("Deleted all vectors in namespace '%s'.", ns)
+    return True
 
 
 def copy_namespace(
     config: PineconeConfig,
     source_ns: str,
     target_ns: str,
-    batch_size: int = 100,
+    batch_size: int = MAX_BATCH_VECTORS,
+    max_workers: int = 3,
+    upsert_rate_limit: float | None = UPSERT_RATE_LIMIT,
 ) -> int:
     """Copy all vectors from one namespace to another.
 
-    Uses list + fetch + upsert to move vectors between namespaces.
+    Uses list + fetch + upsert to move vectors between namespaces.  IDs
+    are listed in order (each page needs the previous page's token) and
+    grouped into batches of *batch_size*; the fetch + upsert of up to
+    *max_workers* batches run concurrently, throttled and retried like
+    :meth:`VectorStore.upsert_vectors <tools.pinecone.vector_store.VectorStore.upsert_vectors>`.
     Note: Pinecone's list endpoint requires ``list`` support on your
     index type (available on serverless indexes).
 
@@ -139,7 +173,12 @@ def copy_namespace(
     target_ns : str
         Destination namespace.
     batch_size : int
-        Number of vectors per batch.
+        Number of vectors fetched per request (Pinecone allows up to 1000).
+        Upserts are further split to stay under the request size limit.
+    max_workers : int
+        Maximum number of batches copied concurrently (1 copies serially).
+    upsert_rate_limit : float | None
+        Upsert throughput ceiling in bytes/s (``None`` for no limit).
 
     Returns
     -------
@@ -147,44 +186,92 @@ def copy_namespace(
         Number of vectors copied.
     """
     index = get_index(config)
+    limiter = upsert_limiter(upsert_rate_limit)
     copied = 0
-    pagination_token = None
 
     logger.info("Copying vectors from '%s' to '%s' ...", source_ns, target_ns)
 
+    def copy_batch(vec_ids: list[str]) -> int:
+        # Fetch full vectors, then upsert them into the target namespace
+        fetch_response = retry_call(index.fetch, ids=vec_ids, namespace=source_ns)
+        vectors_data = fetch_response.get("vectors", {})
+
+        batch = [
+            {
+                "id": vec_id,
+                "values": vec_data.get("values", []),
+                "metadata": vec_data.get("metadata", {}),
+            }
+            for vec_id, vec_data in vectors_data.items()
+        ]
+        for part in vector_batches(batch):
+            send_upsert(index, as_upsert_tuples(part), target_ns, limiter)
+        return len(batch)
+
+    # List pages are capped well below the fetch limit — regroup the IDs.
+    pages = _iter_id_pages(index, source_ns, min(batch_size, _LIST_LIMIT))
+    batches = chunks(chain.from_iterable(pages), batch_size)
+    for count in run_concurrently(copy_batch, batches, max_workers):
+        copied += count
+        logger.info("Copied %d vectors (%d total)", count, copied)
+
+    clear_stats_cache(config.index_name)
+    logger.info("Done. Copied %d vector(s) from '%s' to '%s'.", copied, source_ns, target_ns)
+    return copied
+
+
+def clear_stats_cache(index_name: str | None = None) -> None:
+    """Drop cached index stats for *index_name*, or for every index if ``None``.
+
+    Writes made here clear the cache themselves, as do those made through
+    :class:`~tools.pinecone.vector_store.VectorStore`; call this after
+    changing an index by other means to avoid up to ``_STATS_TTL`` seconds
+    of stale counts.
+    """
+    if index_name is None:
+        _stats_cache.clear()
+    else:
+        _stats_cache.pop(index_name, None)
+
+
+# ── internal helpers ────────────────────────────────────────────────────────
+
+def _namespace_counts(stats: dict) -> dict[str, int]:
+    """Map namespace name to vector count from ``describe_index_stats()`` output."""
+    return {
+        ns: ns_stats.get("vector_count", 0)
+        for ns, ns_stats in stats.get("namespaces", {}).items()
+    }
+
+
+def _iter_id_pages(index, namespace: str, batch_size: int) -> Iterator[list[str]]:
+    """Yield the vector IDs of *namespace* one listed page at a time."""
+    pagination_token = None
+
     while True:
-        # List vector IDs in source namespace
-        list_kwargs = {"namespace": source_ns, "limit": batch_size}
+        list_kwargs = {"namespace": namespace, "limit": batch_size}
         if pagination_token:
             list_kwargs["pagination_token"] = pagination_token
 
         list_response = index.list(**list_kwargs)
-        vec_ids = [v for v in (list_response.get("vectors", []) or [])]
+        vec_ids = list_response.get("vectors", []) or []
 
         if not vec_ids:
             break
 
-        # Fetch full vectors
-        fetch_response = index.fetch(ids=vec_ids, namespace=source_ns)
-        vectors_data = fetch_response.get("vectors", {})
-
-        # Upsert into target namespace
-        batch = []
-        for vec_id, vec_data in vectors_data.items():
-            batch.append({
-                "id": vec_id,
-                "values": vec_data.get("values", []),
-                "metadata": vec_data.get("metadata", {}),
-            })
-
-        if batch:
-            index.upsert(vectors=batch, namespace=target_ns)
-            copied += len(batch)
-            logger.info("Copied %d vectors (%d total)", len(batch), copied)
+        yield vec_ids
 
         pagination_token = list_response.get("pagination", {}).get("next")
         if not pagination_token:
             break
 
-    logger.info("Done. Copied %d vector(s) from '%s' to '%s'.", copied, source_ns, target_ns)
-    return copied
+
+def _cached_stats(index, key: str) -> dict:
+    """Return ``index.describe_index_stats()``, reusing a result under ``_STATS_TTL`` old."""
+    now = time.monotonic()
+    cached = _stats_cache.get(key)
+    if cached is not None and now - cached[0] < _STATS_TTL:
+        return cached[1]
+    stats = index.describe_index_stats()
+    _stats_cache[key] = (now, stats)
+    return stats
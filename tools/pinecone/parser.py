@@ -8,6 +8,8 @@ Supports multiple formats:
 - ``.csv``  — Tabular data with ``id``, ``text``, and optional metadata columns
 
 All parsers return a list of dicts ready for ``VectorStore.upsert_texts()``.
+Each has an ``iter_*`` counterpart that yields the same dicts one at a
+time, so large files can be processed without holding every chunk.
 
 Usage
 -----
@@ -20,6 +22,10 @@ Usage
     chunks = parse_docx("knowledgebase.docx")
     chunks = parse_txt("data.txt")
     chunks = parse_csv("data.csv")
+
+    # Stream chunks instead of building the list
+    for chunk in iter_file("knowledgebase.txt"):
+        ...
 """
 
 from __future__ import annotations
@@ -27,13 +33,17 @@ from __future__ import annotations
 import csv
 import hashlib
 import logging
-import re
+from itertools import chain
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, TextIO
 
 logger = logging.getLogger(__name__)
 
 CHUNK_DELIMITER = "--- KB_CHUNK_END ---"
 
+# Read buffer for streamed .txt/.csv files — fewer read syscalls on large files.
+_READ_BUFFER = 1 << 20
+
 
 # ── public API ──────────────────────────────────────────────────────────────
 
@@ -49,11 +59,20 @@ def parse_docx(file_path: str) -> list[dict]:
         A list of dicts with keys ``id``, ``text``, ``type``, ``title`` —
         ready for :py:meth:`VectorStore.upsert_texts`.
     """
+    chunks = list(iter_docx(file_path))
+    logger.info("Parsed %d chunk(s) from knowledge-base text.", len(chunks))
+    return chunks
+
+
+def iter_docx(file_path: str) -> Iterator[dict]:
+    """Yield the chunks of a ``.docx`` knowledge-base file one at a time.
+
+    See :func:`parse_docx`.
+    """
     from docx import Document  # lazy import — only needed for .docx files
 
     doc = Document(file_path)
-    raw_text = "\n".join(p.text for p in doc.paragraphs)
-    return parse_kb_text(raw_text)
+    return _iter_chunks(_iter_segments(p.text for p in doc.paragraphs))
 
 
 def parse_kb_text(raw_text: str) -> list[dict]:
@@ -69,44 +88,86 @@ def parse_kb_text(raw_text: str) -> list[dict]:
     Returns:
         A list of dicts with keys ``id``, ``text``, ``type``, ``title``.
     """
-    segments = raw_text.split(CHUNK_DELIMITER)
-    chunks: list[dict] = []
-
-    for segment in segments:
-        parsed = _parse_single_chunk(segment)
-        if parsed is not None:
-            chunks.append(parsed)
-
+    chunks = list(iter_kb_text(raw_text))
     logger.info("Parsed %d chunk(s) from knowledge-base text.", len(chunks))
     return chunks
 
 
+def iter_kb_text(raw_text: str) -> Iterator[dict]:
+    """Yield the chunks of raw KB-formatted text one at a time.
+
+    See :func:`parse_kb_text`.
+    """
+    return _iter_chunks(raw_text.split(CHUNK_DELIMITER))
+
+
 # ── internal helpers ────────────────────────────────────────────────────────
 
+def _iter_chunks(segments: Iterable[str]) -> Iterator[dict]:
+    """Parse each KB segment, dropping those without a valid chunk."""
+    return (
+        parsed for segment in segments
+        if (parsed := _parse_single_chunk(segment)) is not None
+    )
+
+
+def _iter_segments(lines: Iterable[str]) -> Iterator[str]:
+    """Group *lines* into chunk segments split on ``CHUNK_DELIMITER``.
+
+    Equivalent to ``"\\n".join(lines).split(CHUNK_DELIMITER)``, but only
+    the current segment is held in memory.
+    """
+    buf: list[str] = []
+    for line in lines:
+        if CHUNK_DELIMITER in line:
+            head, *rest = line.split(CHUNK_DELIMITER)
+            buf.append(head)
+            for part in rest:
+                yield "\n".join(buf)
+                buf = [part]
+        else:
+            buf.append(line)
+    yield "\n".join(buf)
+
+
 def _parse_single_chunk(raw: str) -> dict | None:
     """Extract KB_ID, TYPE, TITLE, and TEXT from a single chunk segment.
 
     Returns ``None`` if the segment does not contain a valid ``KB_ID``
     (e.g. section headers or blank space between chunks).
     """
+    header = {"KB_ID": "", "TYPE": "", "TITLE": ""}
+    kb_text = ""
+
+    # One pass over the lines; the header fields precede TEXT, and
+    # everything after the "TEXT:" line is the chunk body.
+    lines = raw.splitlines()
+    i = 0
+    while i < len(lines):
+        field, sep, value = lines[i].strip().partition(":")
+        i += 1
+        if not sep:
+            continue
+        if field == "TEXT":
+            kb_text = "\n".join([value, *lines[i:]]).strip()
+            break
+        if field not in header or header[field]:
+            continue
+        value = value.strip()
+        if not value:
+            # The value may sit on the next non-empty line ("KB_ID:\nkb-3").
+            while i < len(lines) and not lines[i].strip():
+                i += 1
+            if i < len(lines) and lines[i].strip().partition(":")[0] not in (*header, "TEXT"):
+                value = lines[i].strip()
+                i += 1
+        header[field] = value
+    kb_id, kb_type, kb_title = header["KB_ID"], header["TYPE"], header["TITLE"]
+
     # KB_ID is required — skip segments without one
-    m_id = re.search(r"KB_ID:\s*(.+)", raw)
-    if not m_id:
+    if not kb_id:
         return None
 
-    kb_id = m_id.group(1).strip()
-
-    # TYPE and TITLE are optional
-    m_type = re.search(r"TYPE:\s*(.+)", raw)
-    kb_type = m_type.group(1).strip() if m_type else ""
-
-    m_title = re.search(r"TITLE:\s*(.+)", raw)
-    kb_title = m_title.group(1).strip() if m_title else ""
-
-    # TEXT: everything after the "TEXT:" line
-    m_text = re.search(r"TEXT:\s*\n(.*)", raw, re.DOTALL)
-    kb_text = m_text.group(1).strip() if m_text else ""
-
     if not kb_text:
         logger.warning("Chunk '%s' has no TEXT content — skipping.", kb_id)
         return None
@@ -125,6 +186,7 @@ def parse_txt(
     file_path: str | Path,
     paragraph_mode: bool = False,
     min_length: int = 20,
+    fast_hash: bool = False,
 ) -> list[dict]:
     """Parse a ``.txt`` file into upsert-ready chunks.
 
@@ -142,6 +204,9 @@ def parse_txt(
         Force paragraph-based splitting even if delimiters are found.
     min_length : int
         Minimum character length for a paragraph to be kept.
+    fast_hash : bool
+        Derive paragraph IDs with BLAKE2b instead of SHA-256 (faster,
+        but not the same IDs as earlier ingests).
 
     Returns
     -------
@@ -149,29 +214,81 @@ def parse_txt(
         Upsert-ready chunks with ``id`` and ``text``.
     """
     path = Path(file_path)
-    raw_text = path.read_text(encoding="utf-8")
+    chunks = list(iter_txt(path, paragraph_mode, min_length, fast_hash))
+    logger.info("Parsed %d chunk(s) from %s", len(chunks), path.name)
+    return chunks
+
+
+def iter_txt(
+    file_path: str | Path,
+    paragraph_mode: bool = False,
+    min_length: int = 20,
+    fast_hash: bool = False,
+) -> Iterator[dict]:
+    """Yield the chunks of a ``.txt`` file one at a time.
+
+    See :func:`parse_txt`.
+    """
+    path = Path(file_path)
+
+    if paragraph_mode:
+        return _iter_paragraphs(_split_paragraphs(_read_lines(path)), min_length, fast_hash)
+    return _iter_txt_detect(path, min_length, fast_hash)
 
-    # Try structured format first
-    if not paragraph_mode and CHUNK_DELIMITER in raw_text:
-        return parse_kb_text(raw_text)
 
-    # Paragraph-based splitting
-    paragraphs = re.split(r"\n\s*\n", raw_text)
-    chunks: list[dict] = []
+def _iter_txt_detect(path: Path, min_length: int, fast_hash: bool) -> Iterator[dict]:
+    """Parse *path* as KB chunks if it has a delimiter line, else as paragraphs.
 
+    The file is read once: lines are held only until the first
+    ``CHUNK_DELIMITER``, after which the rest is streamed through the
+    structured parser.  A file without one is split into paragraphs.
+    """
+    head: list[str] = []
+    with open(path, "r", encoding="utf-8", buffering=_READ_BUFFER) as f:
+        for line in f:
+            head.append(line)
+            if CHUNK_DELIMITER in line:
+                lines = (text.rstrip("\n") for text in chain(head, f))
+                yield from _iter_chunks(_iter_segments(lines))
+                return
+    yield from _iter_paragraphs(_split_paragraphs(head), min_length, fast_hash)
+
+
+def _read_lines(path: Path) -> Iterator[str]:
+    """Yield the lines of *path* (with their newlines)."""
+    with open(path, "r", encoding="utf-8", buffering=_READ_BUFFER) as f:
+        yield from f
+
+
+def _split_paragraphs(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the blank-line-separated paragraphs of *lines*, unstripped."""
+    buf: list[str] = []
+    for line in lines:
+        if line.strip():
+            buf.append(line)
+        elif buf:
+            yield "".join(buf)
+            buf = []
+    if buf:
+        yield "".join(buf)
+
+
+def _iter_paragraphs(
+    paragraphs: Iterable[str],
+    min_length: int,
+    fast_hash: bool,
+) -> Iterator[dict]:
+    """Yield a hash-ID chunk for each paragraph of at least *min_length* chars."""
     for para in paragraphs:
         text = para.strip()
         if len(text) < min_length:
             continue
 
-        chunk_id = _text_hash(text)
-        chunks.append({
+        chunk_id = _text_hash(text, fast_hash)
+        yield {
             "id": chunk_id,
             "text": text,
-        })
-
-    logger.info("Parsed %d paragraph(s) from %s", len(chunks), path.name)
-    return chunks
+        }
 
 
 # ── .csv parser ───────────────────────────────────────────────────────────────
@@ -180,6 +297,7 @@ def parse_csv(
     file_path: str | Path,
     id_column: str = "id",
     text_column: str = "text",
+    fast_hash: bool = False,
 ) -> list[dict]:
     """Parse a ``.csv`` file into upsert-ready chunks.
 
@@ -195,6 +313,9 @@ def parse_csv(
         Column name for vector IDs (default ``"id"``).
     text_column : str
         Column name for the text content (default ``"text"``).
+    fast_hash : bool
+        Derive missing IDs with BLAKE2b instead of SHA-256 (see
+        :func:`parse_txt`).
 
     Returns
     -------
@@ -202,38 +323,97 @@ def parse_csv(
         Upsert-ready chunks.
     """
     path = Path(file_path)
-    chunks: list[dict] = []
+    chunks = list(iter_csv(path, id_column, text_column, fast_hash))
+    logger.info("Parsed %d row(s) from %s", len(chunks), path.name)
+    return chunks
+
+
+def iter_csv(
+    file_path: str | Path,
+    id_column: str = "id",
+    text_column: str = "text",
+    fast_hash: bool = False,
+) -> Iterator[dict]:
+    """Yield the chunks of a ``.csv`` file one row at a time.
 
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+    The header is checked eagerly, so a missing text column raises before
+    the caller starts consuming rows.  See :func:`parse_csv`.
 
-        if text_column not in (reader.fieldnames or []):
+    Raises
+    ------
+    ValueError
+        If the file has no *text_column* column.
+    """
+    f = open(file_path, "r", encoding="utf-8", newline="", buffering=_READ_BUFFER)
+    try:
+        reader = csv.reader(f)
+        header = next(reader, None)
+
+        # Resolve column positions once (a repeated name maps to its last
+        # column, as with csv.DictReader).
+        columns = {name: i for i, name in enumerate(header or [])}
+        if text_column not in columns:
             raise ValueError(
                 f"CSV file must have a '{text_column}' column. "
-                f"Found: {reader.fieldnames}"
+                f"Found: {header}"
             )
-
+    except BaseException:
+        f.close()
+        raise
+
+    return _iter_rows(f, reader, columns, id_column, text_column, fast_hash)
+
+
+def _iter_rows(
+    f: TextIO,
+    reader: Iterator[list[str]],
+    columns: dict[str, int],
+    id_column: str,
+    text_column: str,
+    fast_hash: bool,
+) -> Iterator[dict]:
+    """Yield a chunk per data row of *reader*, closing *f* when done."""
+    width = max(columns.values()) + 1
+    text_idx = columns[text_column]
+    id_idx = columns.get(id_column)
+    meta_cols = [
+        (i, name) for name, i in columns.items()
+        if name not in (id_column, text_column)
+    ]
+
+    with f:
         for row in reader:
-            text = (row.get(text_column) or "").strip()
-            if not text:
+            if len(row) < width:
+                if not row:  # blank line
+                    continue
+                row += [""] * (width - len(row))
+
+            if not (text := row[text_idx].strip()):
                 continue
 
-            chunk_id = (row.get(id_column) or "").strip() or _text_hash(text)
+            chunk_id = row[id_idx].strip() if id_idx is not None else ""
+            chunk_id = chunk_id or _text_hash(text, fast_hash)
 
             entry: dict = {"id": chunk_id, "text": text}
             # Add remaining columns as metadata
-            for key, value in row.items():
-                if key not in (id_column, text_column) and value:
+            for i, key in meta_cols:
+                if value := row[i]:
                     entry[key] = value.strip()
 
-            chunks.append(entry)
-
-    logger.info("Parsed %d row(s) from %s", len(chunks), path.name)
-    return chunks
+            yield entry
 
 
 # ── auto-detect parser ────────────────────────────────────────────────────────
 
+# Extension → (list parser, streaming parser).  The keys are also the
+# supported formats listed in the error message.
+_PARSERS: dict[str, tuple[Callable, Callable]] = {
+    ".docx": (lambda p: parse_docx(str(p)), lambda p: iter_docx(str(p))),
+    ".txt": (parse_txt, iter_txt),
+    ".csv": (parse_csv, iter_csv),
+}
+
+
 def parse_file(file_path: str | Path) -> list[dict]:
     """Auto-detect file format and parse into upsert-ready chunks.
 
@@ -255,20 +435,42 @@ def parse_file(file_path: str | Path) -> list[dict]:
         If the file extension is not supported.
     """
     path = Path(file_path)
-    ext = path.suffix.lower()
+    return _format_entry(path)[0](path)
+
+
+def iter_file(file_path: str | Path) -> Iterator[dict]:
+    """Auto-detect file format and yield upsert-ready chunks one at a time.
+
+    See :func:`parse_file`.
+
+    Raises
+    ------
+    ValueError
+        If the file extension is not supported.
+    """
+    path = Path(file_path)
+    return _format_entry(path)[1](path)
 
-    if ext == ".docx":
-        return parse_docx(str(path))
-    elif ext == ".txt":
-        return parse_txt(path)
-    elif ext == ".csv":
-        return parse_csv(path)
-    else:
+
+def _format_entry(path: Path) -> tuple[Callable, Callable]:
+    """Return the ``(parse, iter)`` pair for *path*'s extension."""
+    ext = path.suffix.lower()
+    try:
+        return _PARSERS[ext]
+    except KeyError:
         raise ValueError(
-            f"Unsupported file format '{ext}'. Use .docx, .txt, or .csv."
-        )
+            f"Unsupported file format '{ext}'. Use {', '.join(_PARSERS)}."
+        ) from None
 
 
-def _text_hash(text: str) -> str:
-    """Generate a short deterministic ID from text content."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+def _text_hash(text: str, fast_hash: bool = False) -> str:
+    """Generate a short deterministic ID from text content.
+
+    Both variants give 16 hex characters, but the IDs differ: switching
+    *fast_hash* on for an existing index re-creates every hashed chunk
+    under a new ID instead of overwriting it.
+    """
+    data = text.encode("utf-8")
+    if fast_hash:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+    return hashlib.sha256(data).hexdigest()[:16]
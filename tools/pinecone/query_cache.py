@@ -0,0 +1,210 @@
+"""In-process semantic cache for query results — skip repeated searches.
+
+Chat traffic repeats itself: the same question, or a close paraphrase,
+arrives again within minutes.  :class:`QueryCache` keeps recent query
+results in memory and answers from it in two layers:
+
+1. **Exact** — the same query text (and query parameters) returns the
+   cached matches without embedding or querying at all.
+2. **Semantic** — a query whose embedding has cosine similarity of at
+   least ``threshold`` with a cached one reuses that query's matches,
+   saving the Pinecone round-trip.
+
+Entries are evicted least-recently-used beyond ``max_entries``.  With
+``numpy`` installed, cached query vectors are kept as one ``float32``
+matrix and scanned with a single matrix-vector product; plain Python is
+used otherwise.
+
+Usage
+-----
+    from tools.pinecone.query_cache import QueryCache
+    from tools.pinecone.vector_store import VectorStore
+
+    store = VectorStore(cfg, embed_fn=embed, query_cache=QueryCache())
+    store.get_context("How do returns work?")      # embeds + queries
+    store.get_context("how do returns work")       # cache hit
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # optional — faster similarity scan
+    np = None
+
+# Query parameters that must match for a cached result to be reused.
+Scope = tuple
+
+
+class QueryCache:
+    """LRU cache of query results with exact and cosine-similarity lookup.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, threshold: float = 0.97, max_entries: int = 1024) -> None:
+        """
+        Args:
+            threshold:   Minimum cosine similarity for a semantic hit.
+            max_entries: Number of cached queries kept (least recently
+                         used are evicted first).
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (scope, text) -> (dimension, results)
+        self._entries: OrderedDict[tuple, tuple[int, list[dict]]] = OrderedDict()
+        # (scope, dimension) -> unit vectors of those entries, kept stacked
+        self._rows: dict[tuple, _Rows] = {}
+
+    @staticmethod
+    def scope(**params) -> Scope:
+        """Build the scope key for a set of query parameters."""
+        return tuple(sorted(
+            (k, json.dumps(v, sort_keys=True, default=str)) for k, v in params.items()
+        ))
+
+    # ── lookup / store ─────────────────────────────────────────────────────
+
+    def get(self, text: str, scope: Scope) -> list[dict] | None:
+        """Return cached results for exactly *text*, or ``None``."""
+        key = (scope, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, vector: list[float], scope: Scope) -> list[dict] | None:
+        """Return cached results for the most similar query above ``threshold``.
+
+        Vectors of another size (a different embedding model) are never
+        compared.
+        """
+        unit = _normalize(vector)
+        if unit is None:
+            return None
+
+        with self._lock:
+            rows = self._rows.get((scope, len(unit)))
+            best = rows.best(unit) if rows is not None else None
+            if best is None or best[0] < self.threshold:
+                return None
+            key = best[1]
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+
+    def put(self, text: str, vector: list[float], scope: Scope, results: list[dict]) -> None:
+        """Cache *results* for the query *text* embedded as *vector*."""
+        unit = _normalize(vector)
+        if unit is None:
+            return
+
+        key = (scope, text)
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (len(unit), results)
+            rows = self._rows.get((scope, len(unit)))
+            if rows is None:
+                rows = self._rows[(scope, len(unit))] = _Rows(len(unit))
+            rows.add(key, unit)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop every cached result (e.g. after the index changed)."""
+        with self._lock:
+            self._entries.clear()
+            self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── internal ───────────────────────────────────────────────────────────
+
+    def _discard(self, key: tuple) -> None:
+        """Remove *key* from the entries and its scope's rows (lock held)."""
+        dim, _ = self._entries.pop(key)
+        rows = self._rows[(key[0], dim)]
+        rows.remove(key)
+        if not rows.keys:
+            del self._rows[(key[0], dim)]
+
+
+class _Rows:
+    """Unit vectors of one (scope, dimension), stacked for one matrix product.
+
+    With numpy the vectors live in a preallocated ``float32`` matrix that
+    doubles in size when full, so adding a query costs one row copy
+    rather than a rebuild; removal moves the last row into the gap.
+    """
+
+    __slots__ = ("keys", "pos", "matrix")
+
+    def __init__(self, dim: int) -> None:
+        self.keys: list[tuple] = []
+        self.pos: dict[tuple, int] = {}
+        self.matrix = np.empty((16, dim), dtype=np.float32) if np is not None else []
+
+    def add(self, key: tuple, unit) -> None:
+        row = len(self.keys)
+        self.keys.append(key)
+        self.pos[key] = row
+        if np is None:
+            self.matrix.append(unit)
+            return
+        if row == len(self.matrix):
+            grown = np.empty((2 * row, self.matrix.shape[1]), dtype=np.float32)
+            grown[:row] = self.matrix
+            self.matrix = grown
+        self.matrix[row] = unit
+
+    def remove(self, key: tuple) -> None:
+        row = self.pos.pop(key)
+        last_key = self.keys.pop()
+        last = len(self.keys)
+        if row != last:
+            self.keys[row] = last_key
+            self.pos[last_key] = row
+            self.matrix[row] = self.matrix[last]
+        if np is None:
+            self.matrix.pop()
+
+    def best(self, unit) -> tuple[float, tuple] | None:
+        """Return ``(cosine similarity, key)`` of the row closest to *unit*."""
+        n = len(self.keys)
+        if not n:
+            return None
+        if np is not None:
+            scores = self.matrix[:n] @ unit
+            i = int(scores.argmax())
+            return float(scores[i]), self.keys[i]
+        score, i = max(
+            (sum(a * b for a, b in zip(row, unit)), i)
+            for i, row in enumerate(self.matrix)
+        )
+        return score, self.keys[i]
+
+
+def _normalize(vector):
+    """Return *vector* scaled to unit length (``None`` for a zero vector).
+
+    A ``float32`` array when numpy is installed, a list otherwise.
+    """
+    if np is not None:
+        values = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(values))
+        return values / norm if norm else None
+
+    values = [float(x) for x in vector]
+    norm = math.sqrt(sum(x * x for x in values))
+    if not norm:
+        return None
+    return [x / norm for x in values]
@@ -0,0 +1,73 @@
+"""Shared SQLite plumbing for the local caches.
+
+:class:`~tools.pinecone.embed_cache.EmbedCache`,
+:class:`~tools.pinecone.upsert_ledger.UpsertLedger` and
+:class:`~tools.pinecone.text_store.TextStore` each keep one table in a
+single database file, ``~/.cache/chatbotai/cache.db`` by default.  This
+module holds what they have in common: opening the file, a lock for
+sharing the connection between threads, and keyed lookups chunked to
+SQLite's parameter limit.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable
+
+DEFAULT_DB_FILE = Path.home() / ".cache" / "chatbotai" / "cache.db"
+
+# SQLite caps the number of ``?`` parameters per statement (999 on older builds).
+_MAX_SQL_PARAMS = 900
+
+
+class SQLiteStore:
+    """Thread-safe connection to one table of a local cache database."""
+
+    def __init__(self, path: str | Path | None, schema: str) -> None:
+        """
+        Args:
+            path:   Database file.  Defaults to ``~/.cache/chatbotai/cache.db``.
+            schema: ``CREATE TABLE IF NOT EXISTS ...`` statement for the table.
+        """
+        self._path = Path(path) if path else DEFAULT_DB_FILE
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        # WAL lets the stores sharing the file read while another one writes.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(schema)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def _select_in(self, sql: str, keys: list[str], *params) -> dict:
+        """Run a two-column ``SELECT`` over *keys*; return ``{key: value}``.
+
+        *sql* ends in ``IN ({})``, which is filled with placeholders for
+        at most ``_MAX_SQL_PARAMS`` keys per statement; *params* fill any
+        ``?`` before it.
+        """
+        found: dict = {}
+        with self._lock:
+            for i in range(0, len(keys), _MAX_SQL_PARAMS):
+                part = keys[i : i + _MAX_SQL_PARAMS]
+                found.update(self._conn.execute(
+                    sql.format(",".join("?" * len(part))), [*params, *part],
+                ))
+        return found
+
+    def _execute(self, sql: str, *params) -> None:
+        """Run one write statement and commit."""
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    def _execute_many(self, sql: str, rows: Iterable[tuple]) -> None:
+        """Run a write statement once per row of *rows* and commit."""
+        with self._lock:
+            self._conn.executemany(sql, rows)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
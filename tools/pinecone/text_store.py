@@ -0,0 +1,70 @@
+"""Local chunk-text store — keep text out of Pinecone metadata.
+
+By default every upserted chunk carries its full text as ``text``
+metadata, which dominates the index's stored bytes and every query
+response.  With a :class:`TextStore` attached to a
+:class:`~tools.pinecone.vector_store.VectorStore`, the text is written to
+the local SQLite cache database instead (see
+:mod:`tools.pinecone.sqlite_store`), keyed on ``(index, namespace, id)``,
+and looked up by ID when query results come back — callers still see
+``metadata["text"]``.
+
+Usage
+-----
+    from tools.pinecone.text_store import TextStore
+    from tools.pinecone.vector_store import VectorStore
+
+    store = VectorStore(cfg, embed_fn=embed, text_store=TextStore())   # ~/.cache/chatbotai/cache.db
+    store.upsert_texts_batched(chunks, batch_embed_fn=embed_many)      # text stays local
+    store.get_context("How do returns work?")                          # text filled in from the store
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.pinecone.sqlite_store import SQLiteStore
+
+
+class TextStore(SQLiteStore):
+    """SQLite-backed ``(scope, id) -> text`` store.
+
+    *scope* identifies the index and namespace, as built by
+    :meth:`UpsertLedger.scope <tools.pinecone.upsert_ledger.UpsertLedger.scope>`.
+    The store is safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """
+        Args:
+            path: Database file.  Defaults to ``~/.cache/chatbotai/cache.db``.
+        """
+        super().__init__(
+            path,
+            "CREATE TABLE IF NOT EXISTS texts ("
+            "scope TEXT, id TEXT, text TEXT, PRIMARY KEY (scope, id))",
+        )
+
+    # ── lookup / store ─────────────────────────────────────────────────────
+
+    def get_many(self, scope: str, ids: list[str]) -> dict[str, str]:
+        """Return ``{id: text}`` for the IDs among *ids* that are stored."""
+        return self._select_in(
+            "SELECT id, text FROM texts WHERE scope = ? AND id IN ({})", ids, scope,
+        )
+
+    def put_many(self, scope: str, ids: list[str], texts: list[str]) -> None:
+        """Store *texts* under *ids*."""
+        self._execute_many(
+            "INSERT OR REPLACE INTO texts (scope, id, text) VALUES (?, ?, ?)",
+            [(scope, i, t) for i, t in zip(ids, texts)],
+        )
+
+    def delete(self, scope: str, ids: list[str] | None = None) -> None:
+        """Drop the texts for *ids*, or for the whole scope if ``None``."""
+        if ids is None:
+            self._execute("DELETE FROM texts WHERE scope = ?", scope)
+        else:
+            self._execute_many(
+                "DELETE FROM texts WHERE scope = ? AND id = ?", [(scope, i) for i in ids],
+            )
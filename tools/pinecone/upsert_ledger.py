@@ -0,0 +1,85 @@
+"""Local record of upserted text — skip re-upserting unchanged chunks.
+
+Stores the content hash of every text chunk upserted through a
+:class:`~tools.pinecone.vector_store.VectorStore`, keyed on
+``(index, namespace, id)``, in the local SQLite cache database (see
+:mod:`tools.pinecone.sqlite_store`).  On the
+next ingest of the same document, chunks whose text has not changed are
+dropped before they are embedded or sent to Pinecone — no API calls at
+all for an unchanged re-run.
+
+The ledger only knows about writes made through stores it is attached
+to; if vectors are changed by other means, :meth:`UpsertLedger.forget`
+them (or delete the database file) to force a full re-upsert.
+
+Usage
+-----
+    from tools.pinecone.upsert_ledger import UpsertLedger
+    from tools.pinecone.vector_store import VectorStore
+
+    store = VectorStore(cfg, ledger=UpsertLedger())   # ~/.cache/chatbotai/cache.db
+    store.upsert_texts_batched(chunks, batch_embed_fn=embed_many)   # only changed chunks
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.pinecone.sqlite_store import SQLiteStore
+
+
+class UpsertLedger(SQLiteStore):
+    """SQLite-backed ``(scope, id) -> content hash`` record.
+
+    *scope* identifies the index and namespace (see :meth:`scope`).  The
+    ledger is safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """
+        Args:
+            path: Database file.  Defaults to ``~/.cache/chatbotai/cache.db``.
+        """
+        super().__init__(
+            path,
+            "CREATE TABLE IF NOT EXISTS upserts ("
+            "scope TEXT, id TEXT, hash TEXT, PRIMARY KEY (scope, id))",
+        )
+
+    @staticmethod
+    def scope(index_name: str, namespace: str) -> str:
+        """Return the scope key for *namespace* of *index_name*."""
+        return f"{index_name}\0{namespace}"
+
+    # ── lookup / store ─────────────────────────────────────────────────────
+
+    def unchanged(self, scope: str, ids: list[str], hashes: list[str]) -> set[str]:
+        """Return the IDs among *ids* last recorded with the same hash."""
+        found = self._select_in(
+            "SELECT id, hash FROM upserts WHERE scope = ? AND id IN ({})", ids, scope,
+        )
+        return {i for i, h in zip(ids, hashes) if found.get(i) == h}
+
+    def record(self, scope: str, ids: list[str], hashes: list[str]) -> None:
+        """Record that *ids* were upserted with content *hashes*."""
+        self._execute_many(
+            "INSERT OR REPLACE INTO upserts (scope, id, hash) VALUES (?, ?, ?)",
+            [(scope, i, h) for i, h in zip(ids, hashes)],
+        )
+
+    def forget(self, scope: str, ids: list[str] | None = None) -> None:
+        """Drop the records for *ids*, or for the whole scope if ``None``."""
+        if ids is None:
+            self._execute("DELETE FROM upserts WHERE scope = ?", scope)
+        else:
+            self._execute_many(
+                "DELETE FROM upserts WHERE scope = ? AND id = ?", [(scope, i) for i in ids],
+            )
+
+    def forget_index(self, index_name: str) -> None:
+        """Drop the records for every namespace of *index_name*."""
+        # Scopes of one index sort between "<index>\0" and "<index>\1".
+        self._execute(
+            "DELETE FROM upserts WHERE scope >= ? AND scope < ?",
+            self.scope(index_name, ""), f"{index_name}\1",
+        )
@@ -0,0 +1,274 @@
+"""Shared helpers — request batching, bounded concurrency, rate limiting,
+retries, confirmation prompts.
+
+Pinecone accepts at most 1000 vectors and 2 MB per upsert request, and its
+data-plane calls are latency-bound, so bulk operations split their input
+into batches and keep several requests in flight at once — throttled to
+stay under the per-namespace write throughput, and retried when Pinecone
+still answers "too many requests".
+
+Usage
+-----
+    from tools.pinecone.utils import chunks, vector_batches, run_concurrently
+
+    for batch in vector_batches(vectors):
+        index.upsert(vectors=batch, namespace=ns)
+
+    for count in run_concurrently(upsert_one, vector_batches(vectors)):
+        ...
+
+    limiter = TokenBucket(rate=45e6, burst=10e6)      # bytes per second
+    limiter.acquire(batch_bytes)
+    retry_call(index.upsert, vectors=batch, namespace=ns)
+
+    send_upsert(index, batch, ns, upsert_limiter())   # both of the above, default limit
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Pinecone upsert limits (vectors per request, bytes per request — with headroom).
+MAX_BATCH_VECTORS = 1000
+MAX_BATCH_BYTES = 1_800_000
+
+# Default upsert throughput ceiling (bytes/s) and burst — under Pinecone's
+# 50 MB/s per-namespace write limit.
+UPSERT_RATE_LIMIT = 45e6
+UPSERT_BURST = 10e6
+
+# HTTP statuses / gRPC codes worth retrying: throttling and transient
+# server errors.
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_RETRY_CODES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE"}
+
+# Vector fields that fit the client's ``(id, values, metadata)`` tuple form.
+_TUPLE_FIELDS = {"id", "values", "metadata"}
+
+
+def chunks(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of at most *size* items from *iterable*."""
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def content_hash(text: str) -> str:
+    """Return a short, stable hash of *text* (e.g. to detect changed chunks)."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def estimate_vector_bytes(vector: dict | tuple) -> int:
+    """Rough request size of one ``{"id", "values", "metadata"}`` vector.
+
+    ``(id, values[, metadata])`` tuples are accepted too.  Uses 4 bytes per
+    value, matching Pinecone's own batch-size guidance.
+    """
+    if isinstance(vector, tuple):
+        vec_id, values, *rest = vector
+        metadata = rest[0] if rest else None
+    else:
+        vec_id, values, metadata = vector["id"], vector.get("values"), vector.get("metadata")
+    meta_bytes = len(json.dumps(metadata, default=str)) if metadata else 0
+    return 8 + len(vec_id) + 4 * (len(values) if values is not None else 0) + meta_bytes
+
+
+def vector_batches(
+    vectors: Iterable[dict | tuple],
+    max_vectors: int = MAX_BATCH_VECTORS,
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> Iterator[list[dict | tuple]]:
+    """Split *vectors* into upsert batches bounded by count and payload size.
+
+    Accepts dicts or ``(id, values, metadata)`` tuples.  Vectors repeating
+    an ID already in the current batch replace the earlier entry (the
+    later one would overwrite it server-side anyway).
+    """
+    batch: dict[str, dict | tuple] = {}
+    sizes: dict[str, int] = {}
+    batch_bytes = 0
+
+    for vec in vectors:
+        vec_id = vec[0] if isinstance(vec, tuple) else vec["id"]
+        size = estimate_vector_bytes(vec)
+
+        if vec_id in batch:
+            batch_bytes -= sizes[vec_id]
+        elif batch and (len(batch) >= max_vectors or batch_bytes + size > max_bytes):
+            yield list(batch.values())
+            batch, sizes, batch_bytes = {}, {}, 0
+
+        batch[vec_id] = vec
+        sizes[vec_id] = size
+        batch_bytes += size
+
+    if batch:
+        yield list(batch.values())
+
+
+def as_upsert_tuples(vectors: Iterable[dict]) -> list[tuple | dict]:
+    """Convert ``{"id", "values", "metadata"}`` dicts to upsert tuples.
+
+    The Pinecone client accepts ``(id, values, metadata)`` tuples directly,
+    skipping its per-key dict validation.  Vectors carrying extra fields
+    (e.g. ``sparse_values``) are passed through unchanged.
+    """
+    return [
+        (v["id"], v["values"], v.get("metadata") or {})
+        if "values" in v and v.keys() <= _TUPLE_FIELDS else v
+        for v in vectors
+    ]
+
+
+def run_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 8,
+) -> Iterator[R]:
+    """Call ``fn(item)`` for every item on a thread pool.
+
+    Results are yielded in completion order.  At most ``2 * max_workers``
+    items are pulled from *items* ahead of completion, so generator inputs
+    keep streaming.  The first exception raised by *fn* propagates.  A
+    single item is run inline, without starting a pool.
+    """
+    it = iter(items)
+    if max_workers > 1:
+        head = list(islice(it, 2))
+        if len(head) > 1:
+            yield from _run_pooled(fn, chain(head, it), max_workers)
+            return
+        it = iter(head)
+
+    for item in it:
+        yield fn(item)
+
+
+def _run_pooled(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = set()
+        for item in items:
+            pending.add(pool.submit(fn, item))
+            if len(pending) >= 2 * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        for fut in as_completed(pending):
+            yield fut.result()
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Tokens (e.g. request bytes) refill at *rate* per second up to *burst*.
+    :meth:`acquire` blocks until enough have accumulated, so concurrent
+    senders share one throughput ceiling.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float) -> None:
+        """Take *amount* tokens, sleeping until they are available.
+
+        Requests larger than *burst* wait for a full bucket and then
+        overdraw it, so they still go through at the average rate.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait_for = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_for:
+            time.sleep(wait_for)
+
+
+def upsert_limiter(rate: float | None = UPSERT_RATE_LIMIT) -> TokenBucket | None:
+    """Return a :class:`TokenBucket` for *rate* upsert bytes/s (``None`` for no limit)."""
+    return TokenBucket(rate=rate, burst=UPSERT_BURST) if rate else None
+
+
+def send_upsert(index, batch: list, namespace: str, limiter: TokenBucket | None = None) -> int:
+    """Upsert one *batch* under *limiter*, retrying throttled requests.
+
+    Returns the number of vectors sent.
+    """
+    if limiter is not None:
+        limiter.acquire(sum(map(estimate_vector_bytes, batch)))
+    retry_call(index.upsert, vectors=batch, namespace=namespace)
+    return len(batch)
+
+
+def retry_call(
+    fn: Callable[..., R],
+    *args,
+    attempts: int = 6,
+    initial: float = 0.5,
+    max_delay: float = 30.0,
+    **kwargs,
+) -> R:
+    """Call ``fn(*args, **kwargs)``, retrying throttled or transient failures.
+
+    Errors carrying HTTP status 429/5xx (REST client) or gRPC code
+    ``RESOURCE_EXHAUSTED``/``UNAVAILABLE`` are retried up to *attempts*
+    times in total, sleeping with exponential backoff and full jitter
+    (``initial``, doubling, capped at *max_delay*).  Anything else, and
+    the last failure, propagates.
+    """
+    attempt = 1
+    while True:
+        try:
+            return fn(*args, **kwargs)
+        except Exception as exc:
+            if attempt >= attempts or not _is_transient(exc):
+                raise
+            delay = random.uniform(0, min(max_delay, initial * 2 ** (attempt - 1)))
+            attempt += 1
+            logger.warning("%s — retrying in %.1f s (attempt %d/%d)",
+                           exc.__class__.__name__, delay, attempt, attempts)
+            time.sleep(delay)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether *exc* looks like throttling or a transient server error."""
+    if getattr(exc, "status", None) in _RETRY_STATUSES:
+        return True
+    code = getattr(exc, "code", None)
+    if callable(code):
+        try:
+            code = code()
+        except Exception:
+            return False
+    return getattr(code, "name", code) in _RETRY_CODES
+
+
+def confirm(prompt: str) -> bool:
+    """Ask a yes/no question on stdin; return ``True`` only for yes.
+
+    The answer may be piped in (``echo y | ...``).  A stdin with no input
+    at all (closed, or ``/dev/null`` under cron) answers no instead of
+    raising.
+    """
+    try:
+        answer = input(prompt)
+    except EOFError:
+        return False
+    return answer.strip().lower() in ("y", "yes")
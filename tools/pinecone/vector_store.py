@@ -17,31 +17,74 @@ Usage
         {"id": "doc-1", "values": [0.1, 0.2, ...], "metadata": {"text": "hello"}},
     ])
 
+    # -- upsert a 2-D numpy array, one row per ID --
+    store.upsert_matrix(ids, embed_batch(texts, as_array=True), metadatas)
+
     # -- upsert text (requires an embed function) --
     store.upsert_texts(
         texts=[{"id": "doc-1", "text": "hello world"}],
         embed_fn=my_embed_function,      # str -> list[float]
     )
 
+    # -- upsert text with one embedding call per batch --
+    store.upsert_texts_batched(
+        texts=[{"id": "doc-1", "text": "hello world"}],
+        batch_embed_fn=my_batch_embed,   # list[str] -> list[list[float]]
+    )
+
     # -- query with a pre-computed vector --
     results = store.query(vector=[0.1, 0.2, ...], top_k=5)
 
     # -- query with text --
     results = store.query_text("search terms", embed_fn=my_embed, top_k=5)
+
+    # -- matches as numpy arrays (requires numpy) --
+    ids, scores, values, metas = store.query_numpy(vector, top_k=100)
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Callable
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable
 
 from tools.pinecone.config import PineconeConfig
 from tools.pinecone.client import get_index
+from tools.pinecone.namespace_manager import clear_stats_cache
+from tools.pinecone.upsert_ledger import UpsertLedger
+from tools.pinecone.utils import (
+    MAX_BATCH_VECTORS,
+    UPSERT_RATE_LIMIT,
+    as_upsert_tuples,
+    chunks,
+    confirm,
+    content_hash,
+    retry_call,
+    run_concurrently,
+    send_upsert,
+    upsert_limiter,
+    vector_batches,
+)
+
+if TYPE_CHECKING:
+    from tools.pinecone.query_cache import QueryCache
+    from tools.pinecone.text_store import TextStore
 
 logger = logging.getLogger(__name__)
 
 # Type alias: a function that turns a string into a float vector.
 EmbedFn = Callable[[str], list[float]]
+# Type alias: a function that embeds many strings in one go.
+BatchEmbedFn = Callable[[list[str]], list[list[float]]]
+
+# Most inputs OpenAI's embeddings endpoint accepts in one request.
+_MAX_EMBED_INPUTS = 2048
+
+# Sentinel the embedding thread sends after its last batch.
+_PIPELINE_DONE = object()
 
 
 class VectorStore:
@@ -51,17 +94,41 @@ class VectorStore:
         self,
         config: PineconeConfig,
         embed_fn: EmbedFn | None = None,
+        query_cache: QueryCache | None = None,
+        upsert_rate_limit: float | None = UPSERT_RATE_LIMIT,
+        ledger: UpsertLedger | None = None,
+        text_store: TextStore | None = None,
     ) -> None:
         """
         Args:
-            config:   Pinecone connection settings.
-            embed_fn: Optional default embedding function (str -> list[float]).
-                      Can also be passed per-call on upsert_texts / query_text.
+            config:      Pinecone connection settings.
+            embed_fn:    Optional default embedding function (str -> list[float]).
+                         Can also be passed per-call on upsert_texts / query_text.
+            query_cache: Optional :class:`~tools.pinecone.query_cache.QueryCache`
+                         answering repeated or near-identical ``query_text`` /
+                         ``get_context`` calls without a Pinecone round-trip.
+                         Cleared whenever this store writes to the index.
+            upsert_rate_limit: Upsert throughput ceiling in bytes/s shared by
+                         all of this store's concurrent upserts (``None`` for
+                         no limit).
+            ledger:      Optional :class:`~tools.pinecone.upsert_ledger.UpsertLedger`
+                         recording the content hash of every text upserted
+                         by ``upsert_texts`` / ``upsert_texts_batched``, so
+                         unchanged texts are skipped on re-ingest.
+            text_store:  Optional :class:`~tools.pinecone.text_store.TextStore`.
+                         Text upserted by ``upsert_texts`` /
+                         ``upsert_texts_batched`` is kept there instead of
+                         in Pinecone metadata, and filled back into
+                         ``metadata["text"]`` of query results.
         """
         self._config = config
         self._index = get_index(config)
         self._namespace = config.namespace
         self._embed_fn = embed_fn
+        self._query_cache = query_cache
+        self._ledger = ledger
+        self._text_store = text_store
+        self._limiter = upsert_limiter(upsert_rate_limit)
 
     # ── helpers ────────────────────────────────────────────────────────────
 
@@ -74,37 +141,113 @@ class VectorStore:
             )
         return fn
 
+    def _invalidate_caches(self) -> None:
+        """Drop cached query results and index stats after a write."""
+        clear_stats_cache(self._config.index_name)
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def _scope(self, namespace: str | None) -> str:
+        """Ledger / text-store key for *namespace* of this store's index."""
+        ns = namespace if namespace is not None else self._namespace
+        return UpsertLedger.scope(self._config.index_name, ns)
+
+    def _fill_texts(self, namespace: str, ids: list[str], metadatas: list[dict]) -> None:
+        """Set ``text`` in *metadatas* from the text store, where it has one."""
+        texts = self._text_store.get_many(self._scope(namespace), ids)
+        for vec_id, metadata in zip(ids, metadatas):
+            if vec_id in texts:
+                metadata["text"] = texts[vec_id]
+
     # ── upsert ─────────────────────────────────────────────────────────────
 
     def upsert_vectors(
         self,
-        vectors: list[dict],
+        vectors: Iterable[dict | tuple],
         namespace: str | None = None,
-    ) -> None:
+        max_workers: int = 8,
+        batch_size: int = MAX_BATCH_VECTORS,
+    ) -> int:
         """Upsert pre-computed vectors into Pinecone.
 
         Each dict in *vectors* must have keys ``id`` and ``values``,
-        and optionally ``metadata``.
+        and optionally ``metadata``.  ``(id, values, metadata)`` tuples are
+        also accepted and passed to the client as-is.  ``values`` may be a
+        numpy array (e.g. rows of ``embed_batch(..., as_array=True)``); it
+        is converted to a list here, at the Pinecone boundary.
+
+        Batches are packed up to Pinecone's per-request limits (1000
+        vectors / ~2 MB, see :func:`~tools.pinecone.utils.vector_batches`)
+        and sent on a thread pool, *max_workers* requests at a time, under
+        the store's ``upsert_rate_limit``.  Throttled or transiently
+        failing requests are retried with backoff; any other error from a
+        batch propagates.
+
+        *vectors* may be any iterable, including a generator: batches are
+        pulled from it as upsert slots free up, so memory holds only the
+        in-flight batches however long the input is.
 
         Args:
-            vectors:   List of {"id": str, "values": list[float], "metadata": dict}.
-            namespace: Override the default namespace.
+            vectors:     Iterable of {"id": str, "values": list[float], "metadata": dict}.
+            namespace:   Override the default namespace.
+            max_workers: Concurrent upsert requests (1 sends batches serially).
+            batch_size:  Most vectors per request (never above Pinecone's 1000,
+                         and also capped at ~2 MB).
+
+        Returns:
+            Number of vectors upserted.
         """
-        ns = namespace or self._namespace
-        batch_size = 100
+        ns = namespace if namespace is not None else self._namespace
         total = 0
 
-        for i in range(0, len(vectors), batch_size):
-            batch = vectors[i : i + batch_size]
-            self._index.upsert(vectors=batch, namespace=ns)
-            total += len(batch)
-            logger.info("Upserted batch %d–%d", i + 1, i + len(batch))
+        def upsert(batch: list) -> int:
+            plain = as_upsert_tuples(map(_plain_values, batch))
+            return send_upsert(self._index, plain, ns, self._limiter)
+
+        batches = vector_batches(vectors, max_vectors=min(batch_size, MAX_BATCH_VECTORS))
+        for count in run_concurrently(upsert, batches, max_workers):
+            total += count
+            logger.debug("Upserted batch of %d (%d total)", count, total)
+        self._invalidate_caches()
 
         logger.info("Upserted %d vectors into namespace '%s'.", total, ns)
+        return total
+
+    def upsert_matrix(
+        self,
+        ids: list[str],
+        matrix,
+        metadatas: list[dict] | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        """Upsert a 2-D array of vectors, one row per ID.
+
+        The rows of *matrix* (e.g. ``embed_batch(..., as_array=True)``)
+        stay in the array until their batch is sent; each is converted
+        to a list only at the Pinecone boundary, so a large ingest never
+        holds more than one batch as Python floats.
+
+        Args:
+            ids:       Vector IDs, one per row.
+            matrix:    Array of shape ``(len(ids), dim)``.
+            metadatas: Optional metadata dicts, one per row.
+            namespace: Override the default namespace.
+
+        Raises:
+            ValueError: If *ids*, *matrix* and *metadatas* differ in length.
+        """
+        if len(matrix) != len(ids) or (metadatas is not None and len(metadatas) != len(ids)):
+            raise ValueError(
+                f"upsert_matrix needs one row and metadata per ID: got {len(ids)} "
+                f"id(s), {len(matrix)} row(s), "
+                f"{len(metadatas) if metadatas is not None else 'no'} metadata."
+            )
+        metadatas = metadatas if metadatas is not None else [{}] * len(ids)
+        self.upsert_vectors(zip(ids, matrix, metadatas), namespace=namespace)
 
     def upsert_texts(
         self,
-        texts: list[dict],
+        texts: Iterable[dict],
         embed_fn: EmbedFn | None = None,
         namespace: str | None = None,
     ) -> None:
@@ -113,26 +256,125 @@ class VectorStore:
         Each dict in *texts* must have keys ``id`` and ``text``.
         Any extra keys are stored as metadata alongside ``text``.
 
+        Runs through :meth:`upsert_texts_batched` with *embed_fn* applied
+        per text, so embedding and upserting overlap.  Prefer calling
+        that method with a batch embedding function, which needs one API
+        call per batch instead of one per text.
+
         Args:
-            texts:    List of {"id": str, "text": str, ...extra metadata}.
+            texts:    Iterable of {"id": str, "text": str, ...extra metadata}.
             embed_fn: Embedding function (str -> list[float]).
             namespace: Override the default namespace.
         """
         fn = self._resolve_embed_fn(embed_fn)
-        vectors = []
-
-        for item in texts:
-            doc_id = item["id"]
-            text = item["text"]
-            metadata = {k: v for k, v in item.items() if k != "id"}
-            embedding = fn(text)
-            vectors.append({
-                "id": doc_id,
-                "values": embedding,
-                "metadata": metadata,
-            })
+        self.upsert_texts_batched(texts, batch_embed_fn=_per_text(fn), namespace=namespace)
+
+    def upsert_texts_batched(
+        self,
+        texts: Iterable[dict],
+        batch_embed_fn: BatchEmbedFn,
+        namespace: str | None = None,
+        batch_size: int = 100,
+        embed_workers: int = 4,
+        max_workers: int = 8,
+        skip_unchanged: bool = True,
+    ) -> int:
+        """Embed text items in batches and upsert them into Pinecone.
+
+        Like :meth:`upsert_texts`, but embeds *batch_size* texts per call
+        to *batch_embed_fn* instead of one text per call.  Embedding runs
+        on background threads (*embed_workers* calls in flight) while
+        earlier batches are upserted, so the two network-bound stages
+        overlap.  At most a few embedded batches wait for upsert at once.
+
+        With a ``ledger``, the content hashes of each batch are recorded
+        once it is upserted, and (with *skip_unchanged*) texts whose hash
+        matches the one last upserted under the same ID are dropped
+        before embedding.  With a
+        ``text_store``, each text is saved there and left out of the
+        vector's metadata.
 
-        self.upsert_vectors(vectors, namespace=namespace)
+        Args:
+            texts:          Iterable of {"id": str, "text": str, ...extra metadata};
+                            a generator is consumed one batch at a time.
+            batch_embed_fn: Batch embedding function (list[str] -> list[list[float]]).
+            namespace:      Override the default namespace.
+            batch_size:     Number of texts per embedding call.
+            embed_workers:  Concurrent embedding calls (1 embeds serially).
+            max_workers:    Concurrent upsert requests (see :meth:`upsert_vectors`).
+            skip_unchanged: Skip texts the ledger has recorded as unchanged.
+
+        Returns:
+            Number of texts upserted (not counting skipped ones).
+        """
+        ready: queue.Queue = queue.Queue(maxsize=4)
+        stop = threading.Event()
+
+        def hand_over(item) -> None:
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        ledger, text_store = self._ledger, self._text_store
+        scope = self._scope(namespace)
+        dropped = {"id", "text"} if text_store is not None else {"id"}
+
+        def embed(batch: list[dict]) -> tuple[list[dict], list[dict], list[str]]:
+            hashes = []
+            if ledger is not None:
+                hashes = [content_hash(item["text"]) for item in batch]
+            if ledger is not None and skip_unchanged:
+                skip = ledger.unchanged(scope, [item["id"] for item in batch], hashes)
+                if skip:
+                    logger.debug("Skipping %d unchanged text(s)", len(skip))
+                    kept = [(item, h) for item, h in zip(batch, hashes) if item["id"] not in skip]
+                    batch = [item for item, _ in kept]
+                    hashes = [h for _, h in kept]
+            if not batch:
+                return [], [], []
+
+            embeddings = batch_embed_fn([item["text"] for item in batch])
+            vectors = [
+                {
+                    "id": item["id"],
+                    "values": embedding,
+                    "metadata": {k: v for k, v in item.items() if k not in dropped},
+                }
+                for item, embedding in zip(batch, embeddings)
+            ]
+            return batch, vectors, hashes
+
+        def produce() -> None:
+            try:
+                batches = chunks(texts, batch_size)
+                for embedded in run_concurrently(embed, batches, embed_workers):
+                    if stop.is_set():
+                        return
+                    if embedded[0]:
+                        hand_over(embedded)
+            finally:
+                hand_over(_PIPELINE_DONE)
+
+        upserted = 0
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            producer = pool.submit(produce)
+            try:
+                while (embedded := ready.get()) is not _PIPELINE_DONE:
+                    batch, vectors, hashes = embedded
+                    ids = [item["id"] for item in batch]
+                    if text_store is not None:
+                        text_store.put_many(scope, ids, [item["text"] for item in batch])
+                    self.upsert_vectors(vectors, namespace=namespace, max_workers=max_workers)
+                    if ledger is not None:
+                        ledger.record(scope, ids, hashes)
+                    upserted += len(ids)
+            finally:
+                stop.set()
+            producer.result()
+        return upserted
 
     # ── query ──────────────────────────────────────────────────────────────
 
@@ -172,7 +414,7 @@ class VectorStore:
             List of ``{"id", "score", "metadata"}`` dicts (plus ``"values"``
             if *include_values* is True).
         """
-        ns = namespace or self._namespace
+        ns = namespace if namespace is not None else self._namespace
         kwargs = {
             "vector": vector,
             "top_k": top_k,
@@ -189,13 +431,82 @@ class VectorStore:
             entry = {
                 "id": m["id"],
                 "score": m["score"],
-                "metadata": m.get("metadata", {}),
+                "metadata": m.get("metadata") or {},
             }
             if include_values:
                 entry["values"] = m.get("values", [])
             output.append(entry)
+        if self._text_store is not None and include_metadata and output:
+            self._fill_texts(ns, [e["id"] for e in output], [e["metadata"] for e in output])
         return output
 
+    def query_numpy(
+        self,
+        vector: list[float],
+        top_k: int = 5,
+        namespace: str | None = None,
+        filter: dict | None = None,
+        include_values: bool = True,
+        include_metadata: bool = True,
+    ):
+        """Query the index and return the matches as numpy arrays.
+
+        Like :meth:`query`, but scores and match vectors come back as
+        ``float32`` arrays rather than per-match dicts of Python floats —
+        for callers that rank or compare the results with numpy anyway.
+        Requires numpy.
+
+        Parameters
+        ----------
+        vector : list[float]
+            Query vector.
+        top_k : int
+            Number of results to return.
+        namespace : str | None
+            Override the default namespace.
+        filter : dict | None
+            Pinecone metadata filter.
+        include_values : bool
+            Return the match vectors (``values`` is ``None`` otherwise).
+        include_metadata : bool
+            Include metadata in results.
+
+        Returns
+        -------
+        tuple
+            ``(ids, scores, values, metadatas)``: a list of IDs, a
+            ``(n,)`` score array, an ``(n, dim)`` array of match vectors
+            (or ``None``; all-zero rows for matches returned without
+            values), and a list of metadata dicts.
+        """
+        np = _numpy()
+        kwargs = {
+            "vector": vector,
+            "top_k": top_k,
+            "include_metadata": include_metadata,
+            "include_values": include_values,
+            "namespace": namespace if namespace is not None else self._namespace,
+        }
+        if filter:
+            kwargs["filter"] = filter
+
+        matches = self._index.query(**kwargs).get("matches", [])
+        ids = [m["id"] for m in matches]
+        scores = np.fromiter((m["score"] for m in matches), dtype=np.float32, count=len(matches))
+        metadatas = [m.get("metadata") or {} for m in matches]
+        if self._text_store is not None and include_metadata and matches:
+            self._fill_texts(kwargs["namespace"], ids, metadatas)
+
+        values = None
+        if include_values:
+            # The index dimension is the query vector's length.
+            values = np.zeros((len(matches), len(vector)), dtype=np.float32)
+            for row, m in zip(values, matches):
+                if m.get("values"):
+                    row[:] = m["values"]
+
+        return ids, scores, values, metadatas
+
     def query_text(
         self,
         text: str,
@@ -206,7 +517,9 @@ class VectorStore:
     ) -> list[dict]:
         """Embed *text* then query the index.
 
-        Convenience wrapper around :meth:`query`.
+        Convenience wrapper around :meth:`query`.  With a ``query_cache``,
+        a repeated *text* is answered without embedding, and a text whose
+        embedding is close enough to a cached one without querying.
 
         Parameters
         ----------
@@ -222,8 +535,24 @@ class VectorStore:
             Metadata filter.
         """
         fn = self._resolve_embed_fn(embed_fn)
+        cache = self._query_cache
+        if cache is None:
+            return self.query(fn(text), top_k=top_k, namespace=namespace, filter=filter)
+
+        scope = cache.scope(
+            namespace=namespace if namespace is not None else self._namespace,
+            top_k=top_k, filter=filter,
+        )
+        if (hit := cache.get(text, scope)) is not None:
+            return hit
+
         vector = fn(text)
-        return self.query(vector, top_k=top_k, namespace=namespace, filter=filter)
+        if (hit := cache.get_similar(vector, scope)) is not None:
+            return hit
+
+        results = self.query(vector, top_k=top_k, namespace=namespace, filter=filter)
+        cache.put(text, vector, scope, results)
+        return results
 
     def query_batch(
         self,
@@ -232,8 +561,16 @@ class VectorStore:
         top_k: int = 5,
         namespace: str | None = None,
         filter: dict | None = None,
+        batch_embed_fn: BatchEmbedFn | None = None,
+        max_workers: int = 8,
     ) -> list[list[dict]]:
-        """Query the index with multiple texts in sequence.
+        """Query the index with multiple texts.
+
+        With *batch_embed_fn*, all texts are embedded in one call (per
+        ``_MAX_EMBED_INPUTS`` texts) instead of one call per text.  The
+        queries (and per-text embedding calls) run on a thread pool,
+        *max_workers* at a time, so the round-trips overlap.  Results keep
+        the order of *texts*.
 
         Parameters
         ----------
@@ -247,20 +584,35 @@ class VectorStore:
             Namespace override.
         filter : dict | None
             Metadata filter applied to every query.
+        batch_embed_fn : BatchEmbedFn | None
+            Batch embedding function; takes precedence over *embed_fn*.
+        max_workers : int
+            Concurrent query requests (1 queries serially).
 
         Returns
         -------
         list[list[dict]]
             One result list per input text.
         """
-        fn = self._resolve_embed_fn(embed_fn)
-        all_results = []
-        for text in texts:
-            vector = fn(text)
-            matches = self.query(
-                vector, top_k=top_k, namespace=namespace, filter=filter,
-            )
-            all_results.append(matches)
+        if batch_embed_fn is not None:
+            inputs = [
+                vector
+                for batch in chunks(texts, _MAX_EMBED_INPUTS)
+                for vector in batch_embed_fn(batch)
+            ]
+            embed = None
+        else:
+            # Embed inside each job, so the embedding calls overlap too.
+            inputs, embed = texts, self._resolve_embed_fn(embed_fn)
+
+        def query(job: tuple[int, object]) -> tuple[int, list[dict]]:
+            i, item = job
+            vector = embed(item) if embed is not None else item
+            return i, self.query(vector, top_k=top_k, namespace=namespace, filter=filter)
+
+        all_results: list[list[dict]] = [[] for _ in texts]
+        for i, matches in run_concurrently(query, enumerate(inputs), max_workers):
+            all_results[i] = matches
         return all_results
 
     def get_context(
@@ -293,15 +645,11 @@ class VectorStore:
         """
         docs = self.query_text(text, embed_fn=embed_fn, top_k=top_k,
                                namespace=namespace, filter=filter)
-        if not docs:
-            return ""
-        chunks = []
-        for i, doc in enumerate(docs, 1):
-            if doc["score"] < min_score:
-                continue
-            doc_text = doc["metadata"].get("text", "")
-            chunks.append(f"[{i}] {doc_text}")
-        return "\n\n".join(chunks)
+        return "\n\n".join([
+            f"[{i}] {doc['metadata'].get('text', '')}"
+            for i, doc in enumerate(docs, 1)
+            if doc["score"] >= min_score
+        ])
 
     # ── delete ─────────────────────────────────────────────────────────────
 
@@ -309,31 +657,69 @@ class VectorStore:
         self,
         ids: list[str],
         namespace: str | None = None,
+        max_workers: int = 4,
     ) -> None:
-        """Delete specific vectors by ID."""
-        ns = namespace or self._namespace
-        self._index.delete(ids=ids, namespace=ns)
+        """Delete specific vectors by ID.
+
+        Pinecone accepts at most 1000 IDs per delete request, so *ids* is
+        split into requests of that size, sent *max_workers* at a time
+        and retried when throttled.
+        """
+        ns = namespace if namespace is not None else self._namespace
+
+        def delete(batch: list[str]) -> None:
+            retry_call(self._index.delete, ids=batch, namespace=ns)
+
+        try:
+            for _ in run_concurrently(delete, chunks(ids, MAX_BATCH_VECTORS), max_workers):
+                pass
+        finally:
+            self._invalidate_caches()
+        # Only once Pinecone has dropped the vectors — after a failed delete
+        # they are still there and still need their text.
+        if self._ledger is not None:
+            self._ledger.forget(self._scope(ns), ids)
+        if self._text_store is not None:
+            self._text_store.delete(self._scope(ns), ids)
         logger.info("Deleted %d vector(s) from namespace '%s'.", len(ids), ns)
 
     def delete_all(
         self,
         namespace: str | None = None,
         skip_confirm: bool = False,
-    ) -> None:
-        """Delete every vector in a namespace."""
-        ns = namespace or self._namespace
+    ) -> bool:
+        """Delete every vector in a namespace.
+
+        Unless *skip_confirm*, the namespace's current vector count is
+        looked up and shown in the confirmation prompt; an empty or
+        missing namespace is left alone without asking.
+
+        Returns ``False`` if the confirmation was declined and ``True``
+        once the namespace is empty.
+        """
+        ns = namespace if namespace is not None else self._namespace
 
         if not skip_confirm:
-            answer = input(
-                f"\nDelete ALL vectors in namespace '{ns}' of index "
+            stats = retry_call(self._index.describe_index_stats)
+            count = (stats.get("namespaces") or {}).get(ns, {}).get("vector_count", 0)
+            if not count:
+                logger.warning("Namespace '%s' does not exist or is empty.", ns)
+                return True
+            if not confirm(
+                f"\nDelete ALL {count} vector(s) in namespace '{ns}' of index "
                 f"'{self._config.index_name}'? This is irreversible. [y/N] "
-            )
-            if answer.strip().lower() not in ("y", "yes"):
+            ):
                 logger.info("Aborted.")
-                return
-
-        self._index.delete(delete_all=True, namespace=ns)
+                return False
+
+        retry_call(self._index.delete, delete_all=True, namespace=ns)
+        self._invalidate_caches()
+        if self._ledger is not None:
+            self._ledger.forget(self._scope(ns))
+        if self._text_store is not None:
+            self._text_store.delete(self._scope(ns))
         logger.info("Deleted all vectors in namespace '%s'.", ns)
+        return True
 
     # ── metadata ───────────────────────────────────────────────────────────
 
@@ -344,8 +730,9 @@ class VectorStore:
         namespace: str | None = None,
     ) -> None:
         """Update metadata on an existing vector without changing its values."""
-        ns = namespace or self._namespace
-        self._index.update(id=vector_id, set_metadata=metadata, namespace=ns)
+        ns = namespace if namespace is not None else self._namespace
+        retry_call(self._index.update, id=vector_id, set_metadata=metadata, namespace=ns)
+        self._invalidate_caches()
         logger.info("Updated metadata for '%s' in namespace '%s'.", vector_id, ns)
 
     # ── fetch ──────────────────────────────────────────────────────────────
@@ -369,7 +756,7 @@ class VectorStore:
         list[dict]
             ``{"id", "values", "metadata"}`` for each found ID.
         """
-        ns = namespace or self._namespace
+        ns = namespace if namespace is not None else self._namespace
         response = self._index.fetch(ids=ids, namespace=ns)
         vectors = response.get("vectors", {})
         results = []
@@ -377,8 +764,10 @@ class VectorStore:
             results.append({
                 "id": vec_id,
                 "values": vec_data.get("values", []),
-                "metadata": vec_data.get("metadata", {}),
+                "metadata": vec_data.get("metadata") or {},
             })
+        if self._text_store is not None and results:
+            self._fill_texts(ns, [r["id"] for r in results], [r["metadata"] for r in results])
         logger.info("Fetched %d of %d vector(s).", len(results), len(ids))
         return results
 
@@ -387,3 +776,30 @@ class VectorStore:
     def stats(self) -> dict:
         """Return index statistics (total vectors, per-namespace counts, etc.)."""
         return self._index.describe_index_stats()
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+def _numpy():
+    """Import numpy on demand — only needed for :meth:`VectorStore.query_numpy`."""
+    try:
+        import numpy
+    except ImportError:
+        sys.exit("ERROR: pip install numpy")
+    return numpy
+
+
+def _per_text(embed_fn: EmbedFn) -> BatchEmbedFn:
+    """Adapt a single-text *embed_fn* to the batch embedding signature."""
+    return lambda texts: [embed_fn(text) for text in texts]
+
+
+def _plain_values(vector):
+    """Convert array-like ``values`` (e.g. numpy rows) to the plain list Pinecone expects."""
+    if isinstance(vector, dict):
+        values = vector.get("values")
+        if values is not None and not isinstance(values, list) and hasattr(values, "tolist"):
+            return {**vector, "values": values.tolist()}
+    elif isinstance(vector, tuple) and hasattr(vector[1], "tolist"):
+        return (vector[0], vector[1].tolist(), *vector[2:])
+    return vector